@@ -9,9 +9,13 @@ multiplication actions has as its children an ordered list of the individual for
 
 A :py:class:`PathContext` works like a :py:class:`DefaultContext` that only traces an action on a particular path
 in the tree.
+
+A :py:class:`CountingContext` does not build a tree, it only counts the executed actions, formulas and
+the types of operations performed by the formulas into flat counters.
 """
 
 from abc import abstractmethod, ABC
+from collections import Counter
 from copy import deepcopy
 from typing import List, Optional, ContextManager, Any, Sequence, Callable
 
@@ -307,6 +311,64 @@ class PathContext(Context):
         )
 
 
+@public
+class CountingContext(Context):
+    """
+    Context that only counts executed actions, formulas and their operations.
+
+    No tree of actions is built and formula executions do not create any
+    :py:class:`pyecsca.ec.formula.base.FormulaAction`, the formulas report themselves
+    to the context via :py:meth:`count_formula` instead. This makes it a cheap way of
+    cost accounting over many scalar multiplications.
+
+    >>> with local(CountingContext()) as ctx:
+    ...     with Action() as action:
+    ...         pass
+    >>> ctx.actions
+    Counter({'Action': 1})
+    """
+
+    actions: Counter
+    """The counts of entered actions, by the name of their class."""
+    formulas: Counter
+    """The counts of formula executions, by formula."""
+
+    def __init__(self):
+        self.actions = Counter()
+        self.formulas = Counter()
+
+    def enter_action(self, action: Action) -> None:
+        self.actions[action.__class__.__name__] += 1
+
+    def exit_action(self, action: Action) -> None:
+        pass
+
+    def count_formula(self, formula: Any) -> None:
+        """
+        Count an execution of a formula.
+
+        :param formula: The executed formula.
+        """
+        self.formulas[formula] += 1
+
+    @property
+    def operations(self) -> Counter:
+        """The counts of operations performed by the executed formulas, by :py:class:`pyecsca.ec.op.OpType`."""
+        result: Counter = Counter()
+        for formula, count in self.formulas.items():
+            for op_type, op_count in formula.operation_counts.items():
+                result[op_type] += op_count * count
+        return result
+
+    def reset(self) -> None:
+        """Reset all of the counters."""
+        self.actions.clear()
+        self.formulas.clear()
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(formulas={sum(self.formulas.values())}, operations={sum(self.operations.values())})"
+
+
 current: Optional[Context] = None
 
 
@@ -1,9 +1,20 @@
 """Provides a coordinate model class."""
 
 from ast import parse, Module
+from functools import partial
 from importlib_resources.abc import Traversable
 from importlib_resources import as_file
-from typing import List, Any, MutableMapping
+from typing import (
+    List,
+    Any,
+    MutableMapping,
+    Optional,
+    Dict,
+    Tuple,
+    Callable,
+    Iterator,
+    TypeVar,
+)
 
 from public import public
 
@@ -17,7 +28,76 @@ from pyecsca.ec.formula.efd import (
     LadderEFDFormula,
     ScalingEFDFormula,
     NegationEFDFormula,
+    _efd_digest,
+    _efd_cache_load,
+    _efd_cache_store,
 )
+from pyecsca.misc.cfg import getconfig
+
+T = TypeVar("T")
+_NOT_LOADED: Any = object()
+
+
+class _LazyMapping(MutableMapping[str, T]):
+    """
+    A mapping with a fixed set of keys (a manifest) whose values are loaded on first access.
+
+    >>> mapping = _LazyMapping()
+    >>> mapping.add("a", lambda: print("loading") or 1)
+    >>> "a" in mapping, mapping.loaded("a")
+    (True, False)
+    >>> mapping["a"]
+    loading
+    1
+    >>> mapping["a"]
+    1
+    """
+
+    def __init__(self):
+        self._values: Dict[str, Any] = {}
+        self._loaders: Dict[str, Callable[[], T]] = {}
+
+    def add(self, key: str, loader: Callable[[], T]) -> None:
+        """
+        Add a key to the mapping, with its value loaded by the loader on first access.
+
+        :param key: The key.
+        :param loader: The loader of the value.
+        """
+        self._values[key] = _NOT_LOADED
+        self._loaders[key] = loader
+
+    def loaded(self, key: str) -> bool:
+        """Return whether the value of the key is loaded."""
+        return self._values.get(key, _NOT_LOADED) is not _NOT_LOADED
+
+    def __getitem__(self, key: str) -> T:
+        value = self._values[key]
+        if value is _NOT_LOADED:
+            value = self._loaders[key]()
+            self._values[key] = value
+            del self._loaders[key]
+        return value
+
+    def __setitem__(self, key: str, value: T) -> None:
+        self._values[key] = value
+        self._loaders.pop(key, None)
+
+    def __delitem__(self, key: str) -> None:
+        del self._values[key]
+        self._loaders.pop(key, None)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._values
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({list(self._values)!r})"
 
 
 @public
@@ -108,8 +188,9 @@ class EFDCoordinateModel(CoordinateModel):
     """A coordinate model from [EFD]_ data."""
 
     def __new__(cls, *args, **kwargs):
-        _, name, curve_model = args
-        if name in curve_model.coordinates:
+        dir_path, name, curve_model = args
+        if dir_path is None and name in curve_model.coordinates:
+            # Unpickling, see __getnewargs__.
             return curve_model.coordinates[name]
         return object.__new__(cls)
 
@@ -124,32 +205,63 @@ class EFDCoordinateModel(CoordinateModel):
         self.parameters = []
         self.assumptions = []
         self.neutral = []
-        self.formulas = {}
+        self.formulas = _LazyMapping()
+        # Load the parsed formulas from the on-disk cache, if possible.
+        cache_dir = getconfig().ec.efd_cache
+        records = None
+        if cache_dir is not None:
+            key = f"{curve_model.shortname}-{name}"
+            digest = _efd_digest(dir_path)
+            records = _efd_cache_load(cache_dir, key, digest)
         for entry in dir_path.iterdir():
-            with as_file(entry) as file_path:
-                if entry.is_dir():
-                    self.__read_formula_dir(file_path, file_path.stem)
-                else:
+            if entry.is_dir():
+                self.__read_formula_dir(entry, entry.name, records)
+            else:
+                with as_file(entry) as file_path:
                     self.__read_coordinates_file(file_path)
+        if cache_dir is not None and records is None:
+            # This loads all of the formulas, but only once, later they load lazily from the cache.
+            _efd_cache_store(
+                cache_dir,
+                key,
+                digest,
+                {
+                    formula_name: formula._record()
+                    for formula_name, formula in self.formulas.items()
+                },
+            )
 
-    def __read_formula_dir(self, dir_path: Traversable, formula_type):
+    def __read_formula_dir(
+        self,
+        dir_path: Traversable,
+        formula_type,
+        records: Optional[Dict[str, Tuple[Any, ...]]],
+    ):
+        formula_types = {
+            "addition": AdditionEFDFormula,
+            "doubling": DoublingEFDFormula,
+            "tripling": TriplingEFDFormula,
+            "diffadd": DifferentialAdditionEFDFormula,
+            "ladder": LadderEFDFormula,
+            "scaling": ScalingEFDFormula,
+            "negation": NegationEFDFormula,
+        }
+        cls = formula_types.get(formula_type, EFDFormula)
         for entry in dir_path.iterdir():
-            with as_file(entry) as fpath:
-                if fpath.suffix == ".op3":
-                    continue
-                formula_types = {
-                    "addition": AdditionEFDFormula,
-                    "doubling": DoublingEFDFormula,
-                    "tripling": TriplingEFDFormula,
-                    "diffadd": DifferentialAdditionEFDFormula,
-                    "ladder": LadderEFDFormula,
-                    "scaling": ScalingEFDFormula,
-                    "negation": NegationEFDFormula,
-                }
-                cls = formula_types.get(formula_type, EFDFormula)
-                self.formulas[fpath.stem] = cls(
-                    fpath, fpath.with_suffix(".op3"), fpath.stem, self
-                )
+            if entry.name.endswith(".op3"):
+                continue
+            record = records.get(entry.name) if records is not None else None
+            self.formulas.add(
+                entry.name, partial(self.__read_formula, cls, entry, record)
+            )
+
+    def __read_formula(
+        self, cls, entry: Traversable, record: Optional[Tuple[Any, ...]]
+    ) -> Formula:
+        with as_file(entry) as fpath:
+            return cls(
+                fpath, fpath.with_suffix(".op3"), fpath.stem, self, record=record
+            )
 
     def __read_coordinates_file(self, file_path: Traversable):
         with file_path.open("rb") as f:
@@ -1,24 +1,49 @@
 """Provides an abstract base class of a formula."""
 
 from abc import ABC
-from ast import Expression
-from functools import cached_property
+from ast import Expression, Name, walk, fix_missing_locations
+from collections import Counter
+from copy import deepcopy
+from functools import cached_property, lru_cache
 from itertools import product
+from types import CodeType
 
+import numpy as np
 from astunparse import unparse
-from typing import List, Any, ClassVar, MutableMapping, Tuple, Union, Dict
+from typing import (
+    List,
+    Any,
+    ClassVar,
+    MutableMapping,
+    Tuple,
+    Union,
+    Dict,
+    Callable,
+    Iterable,
+    Optional,
+    Sequence,
+    TYPE_CHECKING,
+)
 
 from public import public
 from sympy import FF, symbols, Poly
 
-from pyecsca.ec.context import ResultAction
+from pyecsca.ec.context import ResultAction, CountingContext
 from pyecsca.ec import context
-from pyecsca.ec.error import UnsatisfiedAssumptionError, raise_unsatisified_assumption
+from pyecsca.ec.error import (
+    UnsatisfiedAssumptionError,
+    raise_unsatisified_assumption,
+    raise_non_invertible,
+)
 from pyecsca.ec.mod import Mod, mod, SymbolicMod
-from pyecsca.ec.op import CodeOp, OpType
+from pyecsca.ec.mod.gmp import has_gmp
+from pyecsca.ec.op import CodeOp, OpType, _InversionTransformer
 from pyecsca.misc.cfg import getconfig
 from pyecsca.misc.cache import sympify
 
+if TYPE_CHECKING:
+    from pyecsca.ec.params import DomainParameters
+
 
 @public
 class OpResult:
@@ -109,7 +134,125 @@ class FormulaAction(ResultAction):
         return f"{self.__class__.__name__}({self.formula}, {self.input_points}) = {self.output_points}"
 
 
-_assumption_cache: Dict[Tuple[str, str, FF, Tuple[Mod, ...]], Mod] = {}
+def _const_result(value: Any, field: int, op: str) -> Mod:
+    # Same check and cast as in the traced execution, for ops with constants only (like `Z3 = 1`).
+    if isinstance(value, float):
+        raise AssertionError(
+            f"Bad stuff happened in op {op}, floats will pollute the results."
+        )
+    if not isinstance(value, Mod):
+        value = mod(value, field)
+    return value
+
+
+if has_gmp:
+    from gmpy2 import mpz as _batch_int
+else:
+    _batch_int = int
+
+
+def _batch_inv(values: Any, field: int) -> Any:
+    # Invert a column (or a single value) of integers in the batch execution, using Montgomery's trick.
+    if not isinstance(values, np.ndarray):
+        return _batch_inv(np.array([values], dtype=object), field)[0]
+    result = np.zeros(len(values), dtype=object)
+    nonzero = []
+    for i, value in enumerate(values):
+        if value == 0:
+            raise_non_invertible()
+        else:
+            nonzero.append(i)
+    if not nonzero:
+        return result
+    prefix = [values[nonzero[0]]]
+    for i in nonzero[1:]:
+        prefix.append(prefix[-1] * values[i] % field)
+    try:
+        inverse = pow(prefix[-1], -1, field)
+    except (ValueError, ZeroDivisionError):
+        # Some value is not invertible (the field is not a prime field), invert one by one.
+        for i in nonzero:
+            try:
+                result[i] = pow(values[i], -1, field)
+            except (ValueError, ZeroDivisionError):
+                raise_non_invertible()
+        return result
+    for j in range(len(nonzero) - 1, 0, -1):
+        i = nonzero[j]
+        result[i] = inverse * prefix[j - 1] % field
+        inverse = inverse * values[i] % field
+    result[nonzero[0]] = inverse
+    return result
+
+
+@public
+class BoundFormula:
+    """
+    A formula bound to a curve, i.e. to a field and the curve parameters.
+
+    Binding resolves the formula parameters (like `half`) and checks the assumptions
+    that do not depend on the input points (like `c == 1`) once. Executing the formula
+    on a bound curve then only checks the assumptions on the input points (like `Z1 == 1`).
+    The unsatisfied curve assumptions are stored and reported on every execution, so the
+    configured `unsatisfied_formula_assumption_action` applies to each call, like without binding.
+    """
+
+    formula: "Formula"
+    """The formula that is bound."""
+    field: int
+    """The field over which the formula is bound."""
+    curve_parameters: Dict[str, Mod]
+    """The parameters of the curve."""
+    parameters: Dict[str, Mod]
+    """The resolved formula parameters."""
+    unsatisfied: Tuple[str, ...]
+    """The unsatisfied assumptions that do not depend on the input points."""
+
+    def __init__(
+        self, formula: "Formula", field: int, curve_parameters: Dict[str, Mod]
+    ):
+        self.formula = formula
+        self.field = field
+        self.curve_parameters = curve_parameters
+        params = dict(curve_parameters)
+        self.unsatisfied = tuple(formula._resolve_parameters(field, params))
+        self.parameters = {
+            key: value for key, value in params.items() if key not in curve_parameters
+        }
+        self._params = params
+
+    def __call__(self, *points: Any) -> Tuple[Any, ...]:
+        """
+        Execute the bound formula.
+
+        :param points: Points to pass into the formula.
+        :return: The resulting point(s).
+        """
+        return self.formula._execute(
+            self.field, points, dict(self._params), self.unsatisfied
+        )
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.formula} over GF({self.field}))"
+
+
+@public
+@lru_cache(maxsize=1024)
+def bind_formula(
+    formula: "Formula", field: int, curve_parameters: Tuple[Tuple[str, Mod], ...]
+) -> BoundFormula:
+    """
+    Bind a formula to a curve, cached in a bounded LRU cache.
+
+    The formula execution uses this cache, its hit and miss counts are available
+    via ``bind_formula.cache_info()`` and it can be cleared via ``bind_formula.cache_clear()``.
+
+    :param formula: The formula to bind.
+    :param field: The field over which the formula is bound.
+    :param curve_parameters: The parameters of the curve, as a tuple of (name, value) pairs.
+    :return: The bound formula.
+    """
+    return BoundFormula(formula, field, dict(curve_parameters))
 
 
 @public
@@ -141,6 +284,86 @@ class Formula(ABC):
     def assumptions_str(self):
         return [unparse(assumption)[1:-2] for assumption in self.assumptions]
 
+    @cached_property
+    def _assumptions_split(
+        self,
+    ) -> Tuple[List[Tuple[Expression, str]], List[Tuple[Expression, str]]]:
+        # Split the assumptions into those that depend on the input points and those that do not.
+        point_assumptions = []
+        curve_assumptions = []
+        for assumption, assumption_string in zip(
+            self.assumptions, self.assumptions_str
+        ):
+            names = {node.id for node in walk(assumption) if isinstance(node, Name)}
+            if names & self.inputs:
+                point_assumptions.append((assumption, assumption_string))
+            else:
+                curve_assumptions.append((assumption, assumption_string))
+        return point_assumptions, curve_assumptions
+
+    @cached_property
+    def _assumptions_compiled(self) -> Dict[str, CodeType]:
+        return {
+            assumption_string: compile(assumption, "", mode="eval")
+            for assumption, assumption_string in zip(
+                self.assumptions, self.assumptions_str
+            )
+        }
+
+    @cached_property
+    def _compiled(self) -> Callable[[int, Dict[str, Mod]], Tuple[Tuple[Mod, ...], ...]]:
+        """
+        Compile the whole formula into a single Python function.
+
+        The function takes the field and the parameters (including the unrolled input point coordinates)
+        and returns a tuple of coordinate tuples (ordered as in the coordinate model) for each output point.
+        All of the intermediates live in its locals.
+        """
+        loads = []
+        lines = []
+        loaded = set()
+        written = set()
+        for op in self.code:
+            for name in sorted(op.variables | op.parameters):
+                if name not in written and name not in loaded:
+                    loads.append(f"        {name} = _params_[{name!r}]")
+                    loaded.add(name)
+            code = unparse(op.code.body[0].value).strip()
+            if not op.variables and not op.parameters:
+                lines.append(
+                    f"    {op.result} = _const_result({code}, _field_, {str(op)!r})"
+                )
+            else:
+                lines.append(f"    {op.result} = {code}")
+            written.add(op.result)
+        if loads:
+            # Load all of the inputs upfront, a missing one fails like the exec of an op in the traced execution.
+            lines = [
+                "    try:",
+                *loads,
+                "    except KeyError as e:",
+                '        raise NameError(f"name {e.args[0]!r} is not defined") from None',
+                *lines,
+            ]
+        outputs = []
+        for i in range(self.num_outputs):
+            ind = str(i + self.output_index)
+            coords = []
+            for variable in self.coordinate_model.variables:
+                name = variable + ind
+                if name in written or name in loaded:
+                    coords.append(name)
+                else:
+                    # Not computed by the formula, look it up to fail the same way as the traced execution.
+                    coords.append(f"_params_[{name!r}]")
+            outputs.append(f"({', '.join(coords)},)")
+        lines.append(f"    return ({', '.join(outputs)},)")
+        source = "def _formula(_field_, _params_):\n" + "\n".join(lines) + "\n"
+        namespace: Dict[str, Any] = {"_const_result": _const_result}
+        compiled = compile(source, f"<formula {self}>", "exec")
+        exec(compiled, namespace)  # exec is OK here, skipcq: PYL-W0122
+        return namespace["_formula"]
+
     def __validate_params(self, field, params):
         for key, value in params.items():
             if not isinstance(value, Mod) or value.n != field:
@@ -154,17 +377,17 @@ class Formula(ABC):
         for i, point in enumerate(points):
             if point.coordinate_model != self.coordinate_model:
                 raise ValueError(f"Wrong coordinate model of point {point}.")
-            for coord, value in point.coords.items():
+            for coord, value in zip(self.coordinate_model.variables, point._values):
                 if not isinstance(value, Mod) or value.n != field:
                     raise ValueError(
                         f"Wrong coordinate input {coord} = {value} of point {i}."
                     )
                 params[coord + str(i + 1)] = value
 
-    def __validate_assumption_point(self, assumption, params):
+    def __validate_assumption_point(self, assumption_string, params):
         # Handle an assumption check on value of input points.
         alocals: Dict[str, Union[Mod, int]] = {**params}
-        compiled = compile(assumption, "", mode="eval")
+        compiled = self._assumptions_compiled[assumption_string]
         holds = eval(compiled, None, alocals)  # eval is OK here, skipcq: PYL-W0123
         return holds
 
@@ -172,28 +395,21 @@ class Formula(ABC):
         # Handle a simple parameter assignment (lhs is an unassigned parameter of the formula).
         expr = sympify(rhs, evaluate=False)
         used_symbols = sorted(expr.free_symbols)
-        used_params = []
         for symbol in used_symbols:
             if (value := params.get(symbol.name, None)) is not None:
-                used_params.append(value)
                 if isinstance(value, SymbolicMod):
                     expr = expr.xreplace({symbol: value.x})
                 else:
                     expr = expr.xreplace({symbol: int(value)})
             else:
                 return False
-        cache_key = (lhs, rhs, field, tuple(used_params))
-        if cache_key in _assumption_cache:
-            params[lhs] = _assumption_cache[cache_key]
+        if any(isinstance(x, SymbolicMod) for x in params.values()):
+            params[lhs] = SymbolicMod(expr, field)
         else:
-            if any(isinstance(x, SymbolicMod) for x in params.values()):
-                params[lhs] = SymbolicMod(expr, field)
-            else:
-                domain = FF(field)
-                numerator, denominator = expr.as_numer_denom()
-                val = int(domain.from_sympy(numerator) / domain.from_sympy(denominator))
-                params[lhs] = mod(val, field)
-            _assumption_cache[cache_key] = params[lhs]
+            domain = FF(field)
+            numerator, denominator = expr.as_numer_denom()
+            val = int(domain.from_sympy(numerator) / domain.from_sympy(denominator))
+            params[lhs] = mod(val, field)
         return True
 
     def __validate_assumption_generic(self, lhs, rhs, field, params, assumption_string):
@@ -224,29 +440,36 @@ class Formula(ABC):
             f"'{expr}' has no roots in the base field GF({field})."
         )
 
-    def __validate_assumptions(self, field, params):
-        # Validate assumptions and compute formula parameters.
+    def __validate_assumptions(self, field, params, assumptions) -> List[str]:
+        # Validate assumptions and compute formula parameters, return the unsatisfied assumptions.
         # TODO: Should this also validate coordinate assumptions and compute their parameters?
-        for assumption, assumption_string in zip(
-            self.assumptions, self.assumptions_str
-        ):
+        unsatisfied = []
+        for assumption, assumption_string in assumptions:
             lhs, rhs = assumption_string.split(" == ")
             if lhs in params:
-                if not self.__validate_assumption_point(assumption, params):
-                    raise_unsatisified_assumption(
-                        getconfig().ec.unsatisfied_formula_assumption_action,
-                        f"Unsatisfied assumption in the formula ({assumption_string}).",
-                    )
+                if not self.__validate_assumption_point(assumption_string, params):
+                    unsatisfied.append(assumption_string)
             elif lhs in self.parameters:
                 if not self.__validate_assumption_simple(lhs, rhs, field, params):
-                    raise_unsatisified_assumption(
-                        getconfig().ec.unsatisfied_formula_assumption_action,
-                        f"Unsatisfied assumption in the formula ({assumption_string}).",
-                    )
+                    unsatisfied.append(assumption_string)
             else:
                 self.__validate_assumption_generic(
                     lhs, rhs, field, params, assumption_string
                 )
+        return unsatisfied
+
+    def _resolve_parameters(
+        self, field: int, params: MutableMapping[str, Mod]
+    ) -> List[str]:
+        """
+        Compute the formula parameters and check the assumptions that do not depend on the input points.
+
+        :param field: The field over which the computation is performed.
+        :param params: Parameters of the curve, the formula parameters are added to it.
+        :return: The unsatisfied assumptions.
+        """
+        _, curve_assumptions = self._assumptions_split
+        return self.__validate_assumptions(field, params, curve_assumptions)
 
     def __call__(self, field: int, *points: Any, **params: Mod) -> Tuple[Any, ...]:
         """
@@ -257,44 +480,214 @@ class Formula(ABC):
         :param params: Parameters of the curve.
         :return: The resulting point(s).
         """
+        self.__validate_params(field, params)
+        if not self.assumptions:
+            return self._execute(field, points, params, ())
+        if not any(isinstance(value, SymbolicMod) for value in params.values()):
+            return bind_formula(self, field, tuple(sorted(params.items())))(*points)
+        unsatisfied = self._resolve_parameters(field, params)
+        return self._execute(field, points, params, unsatisfied)
+
+    def _execute(
+        self,
+        field: int,
+        points: Tuple[Any, ...],
+        params: Dict[str, Mod],
+        unsatisfied: Iterable[str],
+    ) -> Tuple[Any, ...]:
+        """
+        Execute the formula with the formula parameters already resolved.
+
+        :param field: The field over which the computation is performed.
+        :param points: Points to pass into the formula.
+        :param params: Parameters of the curve and of the formula, the input point coordinates are added to it.
+        :param unsatisfied: The unsatisfied assumptions that do not depend on the input points.
+        :return: The resulting point(s).
+        """
         from pyecsca.ec.point import Point
 
-        self.__validate_params(field, params)
         self.__validate_points(field, points, params)
-        if self.assumptions:
-            self.__validate_assumptions(field, params)
-        # Execute the actual formula.
+        point_assumptions, _ = self._assumptions_split
+        if point_assumptions:
+            unsatisfied = [
+                *unsatisfied,
+                *self.__validate_assumptions(field, params, point_assumptions),
+            ]
+        for assumption_string in unsatisfied:
+            raise_unsatisified_assumption(
+                getconfig().ec.unsatisfied_formula_assumption_action,
+                f"Unsatisfied assumption in the formula ({assumption_string}).",
+            )
+        current = context.current
+        if isinstance(current, CountingContext):
+            # Only counted, so execute as if nothing was tracing the execution.
+            current.count_formula(self)
+            current = None
+        if current is None:
+            # Nothing is tracing the execution, so skip the action.
+            if getconfig().ec.formula_compilation:
+                return tuple(
+                    Point._trusted(self.coordinate_model, coords, field)
+                    for coords in self._compiled(field, params)
+                )
+            return self.__run(field, params, None)
         with FormulaAction(self, *points, **params) as action:
-            for op in self.code:
-                op_result = op(**params)
-                # This check and cast fixes the issue when the op is `Z3 = 1`.
-                # TODO: This is not general enough, if for example the op is `t = 1/2`, it will be float.
-                #       Temporarily, add an assertion that this does not happen so we do not give bad results.
-                if isinstance(op_result, float):
-                    raise AssertionError(
-                        f"Bad stuff happened in op {op}, floats will pollute the results."
+            return action.exit(self.__run(field, params, action))
+
+    def __run(
+        self, field: int, params: Dict[str, Mod], action: Optional[FormulaAction]
+    ) -> Tuple[Any, ...]:
+        from pyecsca.ec.point import Point
+
+        # Execute the actual formula, op-by-op.
+        for op in self.code:
+            op_result = op(**params)
+            # This check and cast fixes the issue when the op is `Z3 = 1`.
+            # TODO: This is not general enough, if for example the op is `t = 1/2`, it will be float.
+            #       Temporarily, add an assertion that this does not happen so we do not give bad results.
+            if isinstance(op_result, float):
+                raise AssertionError(
+                    f"Bad stuff happened in op {op}, floats will pollute the results."
+                )
+            if not isinstance(op_result, Mod):
+                op_result = mod(op_result, field)
+            if action is not None:
+                action.add_operation(op, op_result)
+            params[op.result] = op_result
+        result = []
+        # Go over the outputs and construct the resulting points.
+        for i in range(self.num_outputs):
+            ind = str(i + self.output_index)
+            full_resulting = {
+                variable + ind: params[variable + ind]
+                for variable in self.coordinate_model.variables
+            }
+            point = Point._trusted(
+                self.coordinate_model, tuple(full_resulting.values()), field
+            )
+
+            if action is not None:
+                action.add_result(point, **full_resulting)
+            result.append(point)
+        return tuple(result)
+
+    @cached_property
+    def _batch_compiled(self) -> List[Tuple[str, CodeType]]:
+        # The ops as expressions over integers (modular reduction is done by the caller),
+        # with the divisions and negative powers replaced by inversions.
+        transformer = _InversionTransformer()
+        return [
+            (
+                op.result,
+                compile(
+                    fix_missing_locations(
+                        Expression(
+                            body=transformer.visit(deepcopy(op.code.body[0].value))
+                        )
+                    ),
+                    f"<batch {op}>",
+                    mode="eval",
+                ),
+            )
+            for op in self.code
+        ]
+
+    def batch(
+        self,
+        field: int,
+        points: Sequence[Sequence[Any]],
+        intermediates: bool = False,
+        **params: Mod,
+    ) -> Tuple[List[Tuple[Any, ...]], Optional[Dict[str, List[np.ndarray]]]]:
+        """
+        Execute a formula over a batch of independent inputs at once.
+
+        The ops of the formula are executed once, over columns (NumPy object arrays) of
+        integers (:py:mod:`gmpy2` integers if available) with one value per input,
+        so the per-call overhead is amortized over the whole batch. The batch execution
+        is not traced, i.e. it does not create a :py:class:`FormulaAction`.
+
+        :param field: The field over which the computation is performed.
+        :param points: The inputs, each being a sequence of points to pass into the formula.
+        :param intermediates: Whether to also return the columns of the intermediates.
+        :param params: Parameters of the curve.
+        :return: The resulting point(s) for each input and, if requested, the columns of the intermediates
+                 (for each op result, the columns assigned to it, in the order they were computed).
+        """
+        from pyecsca.ec.point import Point
+
+        self.__validate_params(field, params)
+        if any(isinstance(value, SymbolicMod) for value in params.values()):
+            raise ValueError(
+                "Cannot execute a formula in a batch with symbolic parameters."
+            )
+        if self.assumptions:
+            bound = bind_formula(self, field, tuple(sorted(params.items())))
+            unsatisfied = list(bound.unsatisfied)
+            params = bound._params
+        else:
+            unsatisfied = []
+        size = len(points)
+        columns: Dict[str, Any] = {
+            key: _batch_int(int(value)) for key, value in params.items()
+        }
+        for name in self.inputs:
+            columns[name] = np.empty(size, dtype=object)
+        for j, inputs in enumerate(points):
+            row: Dict[str, Mod] = {}
+            self.__validate_points(field, inputs, row)
+            for name, value in row.items():
+                columns[name][j] = _batch_int(int(value))
+        point_assumptions, _ = self._assumptions_split
+        for assumption, assumption_string in point_assumptions:
+            holds = eval(  # eval is OK here, skipcq: PYL-W0123
+                self._assumptions_compiled[assumption_string], None, dict(columns)
+            )
+            if not np.all(holds):
+                unsatisfied.append(assumption_string)
+        for assumption_string in unsatisfied:
+            raise_unsatisified_assumption(
+                getconfig().ec.unsatisfied_formula_assumption_action,
+                f"Unsatisfied assumption in the formula ({assumption_string}).",
+            )
+        namespace = {"_inv_": _batch_inv, "_field_": field}
+        computed: Optional[Dict[str, List[np.ndarray]]] = {} if intermediates else None
+        for result, code in self._batch_compiled:
+            column = (
+                eval(code, namespace, columns) % field
+            )  # eval is OK here, skipcq: PYL-W0123
+            if not isinstance(column, np.ndarray):
+                # The op only has constants or parameters (like `Z3 = 1`).
+                column = np.full(size, column, dtype=object)
+            columns[result] = column
+            if computed is not None:
+                computed.setdefault(result, []).append(column)
+        outputs = []
+        variables = self.coordinate_model.variables
+        for i in range(self.num_outputs):
+            ind = str(i + self.output_index)
+            outputs.append(
+                [
+                    Point._trusted(
+                        self.coordinate_model,
+                        tuple(mod(int(value), field) for value in coords),
+                        field,
                     )
-                if not isinstance(op_result, Mod):
-                    op_result = mod(op_result, field)
-                if context.current is not None:
-                    action.add_operation(op, op_result)
-                params[op.result] = op_result
-            result = []
-            # Go over the outputs and construct the resulting points.
-            for i in range(self.num_outputs):
-                ind = str(i + self.output_index)
-                resulting = {}
-                full_resulting = {}
-                for variable in self.coordinate_model.variables:
-                    full_variable = variable + ind
-                    resulting[variable] = params[full_variable]
-                    full_resulting[full_variable] = params[full_variable]
-                point = Point(self.coordinate_model, **resulting)
-
-                if context.current is not None:
-                    action.add_result(point, **full_resulting)
-                result.append(point)
-            return action.exit(tuple(result))
+                    for coords in zip(*(columns[var + ind] for var in variables))
+                ]
+            )
+        return list(zip(*outputs)), computed
+
+    def bind(self, params: "DomainParameters") -> BoundFormula:
+        """
+        Bind the formula to the curve of the given domain parameters.
+
+        :param params: The domain parameters.
+        :return: The bound formula.
+        """
+        return bind_formula(
+            self, params.curve.prime, tuple(sorted(params.curve.parameters.items()))
+        )
 
     def __lt__(self, other):
         if not isinstance(other, Formula):
@@ -342,6 +735,11 @@ class Formula(ABC):
             )
         }
 
+    @cached_property
+    def operation_counts(self) -> Counter:
+        """Return the counts of operations, by their type."""
+        return Counter(op.operator for op in self.code if op.operator is not None)
+
     @property
     def num_operations(self) -> int:
         """Return the number of operations."""
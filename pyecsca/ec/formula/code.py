@@ -1,5 +1,6 @@
 """Provides a concrete class of a formula that has a constructor and some code."""
 
+from functools import cached_property
 from typing import List, Any
 from ast import Expression
 from astunparse import unparse
@@ -40,7 +41,9 @@ class CodeFormula(Formula):
         self.assumptions = assumptions
         self.unified = unified
 
-    def __hash__(self):
+    @cached_property
+    def _hash(self) -> int:
+        # The hash goes over all of the code, it is computed once as formulas are keys of the bind cache.
         return hash(
             (
                 self.name,
@@ -52,6 +55,9 @@ class CodeFormula(Formula):
             )
         )
 
+    def __hash__(self):
+        return self._hash
+
     def __eq__(self, other):
         if not isinstance(other, CodeFormula):
             return False
@@ -66,6 +72,13 @@ class CodeFormula(Formula):
 
     def __getstate__(self):
         state = self.__dict__.copy()
+        for cached in (
+            "_hash",
+            "_compiled",
+            "_assumptions_split",
+            "_assumptions_compiled",
+        ):
+            state.pop(cached, None)
         state["assumptions"] = list(map(unparse, state["assumptions"]))
         return state
 
@@ -1,11 +1,17 @@
 """Provides formulas wrapping the [EFD]_."""
 
+import marshal
+import os
+import sys
 from copy import copy
+from hashlib import sha256
+from tempfile import NamedTemporaryFile
 
+from astunparse import unparse
 from public import public
 
 from importlib_resources.abc import Traversable
-from typing import Any
+from typing import Any, Optional, Tuple, Dict
 
 from pyecsca.ec.formula.code import CodeFormula
 from pyecsca.ec.formula.base import (
@@ -28,8 +34,9 @@ class EFDFormula(Formula):
     """Formula from the [EFD]_."""
 
     def __new__(cls, *args, **kwargs):
-        _, _, name, coordinate_model = args
-        if name in coordinate_model.formulas:
+        meta_path, _, name, coordinate_model, *_ = args
+        if meta_path is None and name in coordinate_model.formulas:
+            # Unpickling, see __getnewargs__.
             return coordinate_model.formulas[name]
         return object.__new__(cls)
 
@@ -39,6 +46,7 @@ class EFDFormula(Formula):
         op3_path: Traversable,
         name: str,
         coordinate_model: Any,
+        record: Optional[Tuple[Any, ...]] = None,
     ):
         self.name = name
         self.coordinate_model = coordinate_model
@@ -47,8 +55,29 @@ class EFDFormula(Formula):
         self.assumptions = []
         self.code = []
         self.unified = False
-        self.__read_meta_file(meta_path)
-        self.__read_op3_file(op3_path)
+        if record is not None:
+            self.__read_record(record)
+        else:
+            self.__read_meta_file(meta_path)
+            self.__read_op3_file(op3_path)
+
+    def __read_record(self, record: Tuple[Any, ...]):
+        meta, parameters, assumptions, unified, ops = record
+        self.meta.update(meta)
+        self.parameters.extend(parameters)
+        self.assumptions.extend(peval(assumption) for assumption in assumptions)
+        self.unified = unified
+        self.code.extend(CodeOp._from_record(op) for op in ops)
+
+    def _record(self) -> Tuple[Any, ...]:
+        # The parsed formula as a tuple that can be marshalled into the EFD cache.
+        return (
+            dict(self.meta),
+            tuple(self.parameters),
+            tuple(unparse(assumption.body).strip() for assumption in self.assumptions),
+            self.unified,
+            tuple(op._record() for op in self.code),
+        )
 
     def __read_meta_file(self, path: Traversable):
         with path.open("rb") as f:
@@ -105,6 +134,75 @@ class EFDFormula(Formula):
         return hash((self.coordinate_model, self.name))
 
 
+_EFD_CACHE_VERSION = 1
+
+
+def _efd_digest(dir_path: Traversable) -> str:
+    # Hash the formula files of a coordinate system directory.
+    digest = sha256()
+    for entry in sorted(dir_path.iterdir(), key=lambda entry: entry.name):
+        if not entry.is_dir():
+            continue
+        for file in sorted(entry.iterdir(), key=lambda file: file.name):
+            digest.update(f"{entry.name}/{file.name}\0".encode())
+            digest.update(file.read_bytes())
+            digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _efd_cache_file(cache_dir: str, key: str) -> str:
+    # The marshal format is specific to the Python version, so it is a part of the name.
+    return os.path.join(cache_dir, f"efd-{key}.{sys.implementation.cache_tag}.marshal")
+
+
+def _efd_cache_load(
+    cache_dir: str, key: str, digest: str
+) -> Optional[Dict[str, Tuple[Any, ...]]]:
+    """
+    Load the records of the formulas of a coordinate system from the EFD cache.
+
+    :param cache_dir: The directory of the cache.
+    :param key: The key of the coordinate system (e.g. `shortw-projective`).
+    :param digest: The digest of the formula files of the coordinate system.
+    :return: The formula records by formula name, or `None` if not cached or the cache is stale.
+    """
+    try:
+        with open(_efd_cache_file(cache_dir, key), "rb") as f:
+            version, cached_digest, records = marshal.loads(f.read())
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if version != _EFD_CACHE_VERSION or cached_digest != digest:
+        return None
+    return records
+
+
+def _efd_cache_store(
+    cache_dir: str, key: str, digest: str, records: Dict[str, Tuple[Any, ...]]
+) -> None:
+    """
+    Store the records of the formulas of a coordinate system into the EFD cache.
+
+    Failures to write the cache (e.g. a read-only directory) are ignored.
+
+    :param cache_dir: The directory of the cache.
+    :param key: The key of the coordinate system (e.g. `shortw-projective`).
+    :param digest: The digest of the formula files of the coordinate system.
+    :param records: The formula records by formula name.
+    """
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with NamedTemporaryFile("wb", dir=cache_dir, delete=False) as f:
+            tmp_name = f.name
+            marshal.dump((_EFD_CACHE_VERSION, digest, records), f)
+        # Replace atomically, so that concurrent processes never see a partial file.
+        os.replace(tmp_name, _efd_cache_file(cache_dir, key))
+    except (OSError, ValueError):
+        try:
+            os.unlink(tmp_name)
+        except (NameError, OSError):
+            pass
+
+
 @public
 class AdditionEFDFormula(AdditionFormula, EFDFormula):
     pass
@@ -109,6 +109,10 @@ class FakePoint(Point):
         """Setter for coordinates, does nothing."""
         pass
 
+    @property
+    def _values(self):
+        return tuple(_fake_coords(self.coordinate_model).values())
+
     def __str__(self):
         return f"FakePoint{id(self)}"
 
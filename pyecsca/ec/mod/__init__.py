@@ -6,11 +6,13 @@ dispatches to the implementation chosen by the runtime configuration of the libr
 (see :py:class:`pyecsca.misc.cfg.Config`). A Python integer based implementation is available under
 :py:class:`RawMod`. A symbolic implementation based on sympy is available under :py:class:`SymbolicMod`. If
 `gmpy2` is installed, a GMP based implementation is available under :py:class:`GMPMod`. If `python-flint` is
-installed, a flint based implementation is available under :py:class:`FlintMod`.
+installed, a flint based implementation is available under :py:class:`FlintMod`. A Python integer based
+implementation that keeps the elements in the Montgomery form is available under :py:class:`MontgomeryMod`.
 """
 
 from .base import *
 from .raw import *
+from .montgomery import *
 from .symbolic import *
 from .gmp import *
 from .flint import *
@@ -3,10 +3,10 @@ import secrets
 from functools import lru_cache, wraps
 
 from public import public
-from typing import Tuple, Any, Dict, Type, Set, TypeVar, Generic
+from typing import Tuple, Any, Dict, Type, Set, TypeVar, Generic, Sequence, List
 
 from pyecsca.ec.context import ResultAction
-from pyecsca.misc.cfg import getconfig
+from pyecsca.misc.cfg import getconfig, TemporaryConfig
 
 
 M = TypeVar("M", bound="Mod")
@@ -481,6 +481,55 @@ class Undefined(Mod["Undefined"]):
         return NotImplemented
 
 
+@public
+def batch_inverse(elements: Sequence[M]) -> List[M]:
+    """
+    Invert many elements at once, using Montgomery's trick.
+
+    Computes all of the inverses using a single inversion and about three multiplications per element.
+    The elements that are zero are not invertible, they are handled as in :py:meth:`Mod.inverse`
+    (see :py:attr:`pyecsca.misc.cfg.ECConfig.no_inverse_action`) and their result is zero.
+
+    >>> batch_inverse([mod(2, 7), mod(0, 7), mod(3, 7)])
+    Traceback (most recent call last):
+    ...
+    pyecsca.ec.error.NonInvertibleError: Element not invertible.
+    >>> batch_inverse([mod(2, 7), mod(3, 7)])
+    [4, 5]
+
+    :param elements: The elements to invert, all modulo the same `n`.
+    :return: The inverses, in the same order.
+    """
+    from pyecsca.ec.error import NonInvertibleError, raise_non_invertible
+
+    result: List[Any] = list(elements)
+    nonzero = []
+    for i, element in enumerate(elements):
+        if element == 0:
+            raise_non_invertible()
+        else:
+            nonzero.append(i)
+    if not nonzero:
+        return result
+    # The prefix products of the non-zero elements.
+    prefix = [elements[nonzero[0]]]
+    for i in nonzero[1:]:
+        prefix.append(prefix[-1] * elements[i])
+    try:
+        with TemporaryConfig() as cfg:
+            cfg.ec.no_inverse_action = "error"
+            inverse = prefix[-1].inverse()
+    except NonInvertibleError:
+        # Some element is not invertible (the modulus is not a prime), invert one by one.
+        return [element.inverse() if element != 0 else element for element in elements]
+    for j in range(len(nonzero) - 1, 0, -1):
+        i = nonzero[j]
+        result[i] = inverse * prefix[j - 1]
+        inverse = inverse * elements[i]
+    result[nonzero[0]] = inverse
+    return result
+
+
 @public
 def mod(x: int, n: int) -> Mod:
     """
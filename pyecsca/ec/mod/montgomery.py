@@ -0,0 +1,253 @@
+from functools import lru_cache, wraps
+
+from public import public
+
+from pyecsca.ec.error import (
+    raise_non_invertible,
+    raise_non_residue,
+)
+from pyecsca.ec.mod.base import (
+    Mod,
+    miller_rabin,
+    jacobi,
+    cube_root_inner,
+    square_root_inner,
+)
+from pyecsca.ec.mod.raw import RawMod
+
+
+class _MontgomeryContext:
+    """Precomputed constants of the Montgomery representation modulo `n`, with R = 2^bits."""
+
+    n: int
+    bits: int
+    mask: int
+    n_prime: int
+    r2: int
+    __slots__ = ("n", "bits", "mask", "n_prime", "r2")
+
+    def __init__(self, n: int):
+        self.n = n
+        self.bits = n.bit_length()
+        self.mask = (1 << self.bits) - 1
+        # n * n_prime = -1 mod R
+        self.n_prime = (-pow(n, -1, 1 << self.bits)) & self.mask
+        self.r2 = pow(1 << self.bits, 2, n)
+
+    def to_montgomery(self, x: int) -> int:
+        return (x << self.bits) % self.n
+
+    def reduce(self, t: int) -> int:
+        # Montgomery reduction (REDC) of t < n * R, computes t * R^-1 mod n.
+        m = ((t & self.mask) * self.n_prime) & self.mask
+        t = (t + m * self.n) >> self.bits
+        if t >= self.n:
+            t -= self.n
+        return t
+
+
+@lru_cache
+def _montgomery_ctx(n: int) -> _MontgomeryContext:
+    return _MontgomeryContext(n)
+
+
+def _new(x: int, ctx: _MontgomeryContext) -> "MontgomeryMod":
+    # Construct an element already in the Montgomery form, skipping the constructor.
+    res = object.__new__(MontgomeryMod)
+    res.x = x
+    res._ctx = ctx
+    return res
+
+
+def _montgomery_check(func):
+    @wraps(func)
+    def method(self, other):
+        if self.__class__ is not type(other):
+            other = self.__class__(other, self.n)
+        elif self._ctx.n != other._ctx.n:
+            raise ValueError
+        return func(self, other)
+
+    return method
+
+
+@public
+class MontgomeryMod(Mod["MontgomeryMod"]):
+    """
+    An element x of ℤₙ (implemented using Python integers in the Montgomery form).
+
+    The element is stored as x * R mod n, with R = 2^k and k the bit-length of n,
+    so that multiplications use the Montgomery reduction instead of a division by n.
+    Values are only converted to and from the Montgomery form on entry and exit
+    (construction, :py:func:`int`, :py:func:`bytes`, comparison with integers).
+    The Montgomery form requires an odd modulus, for an even one a :py:class:`RawMod`
+    is constructed instead.
+    """
+
+    x: int
+    _ctx: _MontgomeryContext
+    __slots__ = ("x", "_ctx")
+
+    def __new__(cls, x: int, n: int):
+        if n % 2 == 0:
+            return RawMod(x, n)
+        return super().__new__(cls)
+
+    def __init__(self, x: int, n: int):
+        self._ctx = _montgomery_ctx(int(n))
+        self.x = self._ctx.to_montgomery(int(x))
+
+    @property
+    def n(self) -> int:
+        return self._ctx.n
+
+    def bit_length(self):
+        return int(self).bit_length()
+
+    def inverse(self) -> "MontgomeryMod":
+        if self.x == 0:
+            raise_non_invertible()
+            return _new(0, self._ctx)
+        try:
+            # (xR)^-1 * R^2 = x^-1 * R
+            res = self._ctx.reduce(pow(self.x, -1, self._ctx.n) * self._ctx.r2)
+            res = self._ctx.reduce(res * self._ctx.r2)
+        except ValueError:
+            raise_non_invertible()
+            res = 0
+        return _new(res, self._ctx)
+
+    def is_residue(self):
+        if not miller_rabin(self.n):
+            raise NotImplementedError
+        if self.x == 0:
+            return True
+        if self.n == 2:
+            return int(self) in (0, 1)
+        legendre_symbol = jacobi(int(self), self.n)
+        return legendre_symbol == 1
+
+    def sqrt(self) -> "MontgomeryMod":
+        if not miller_rabin(self.n):
+            raise NotImplementedError
+        if self.x == 0:
+            return _new(0, self._ctx)
+        if not self.is_residue():
+            raise_non_residue()
+        return square_root_inner(self, int, lambda x: MontgomeryMod(x, self.n))
+
+    def is_cubic_residue(self):
+        if not miller_rabin(self.n):
+            raise NotImplementedError
+        if int(self) in (0, 1):
+            return True
+        if self.n % 3 == 2:
+            return True
+        pm1 = self.n - 1
+        r = self ** (pm1 // 3)
+        return r == 1
+
+    def cube_root(self) -> "MontgomeryMod":
+        if not miller_rabin(self.n):
+            raise NotImplementedError
+        if self.x == 0:
+            return _new(0, self._ctx)
+        if int(self) == 1:
+            return _new(self.x, self._ctx)
+        if not self.is_cubic_residue():
+            raise_non_residue()
+        return cube_root_inner(self, int, lambda x: MontgomeryMod(x, self.n))
+
+    @_montgomery_check
+    def __add__(self, other) -> "MontgomeryMod":
+        res = self.x + other.x
+        if res >= self._ctx.n:
+            res -= self._ctx.n
+        return _new(res, self._ctx)
+
+    @_montgomery_check
+    def __radd__(self, other) -> "MontgomeryMod":
+        return self + other
+
+    @_montgomery_check
+    def __sub__(self, other) -> "MontgomeryMod":
+        res = self.x - other.x
+        if res < 0:
+            res += self._ctx.n
+        return _new(res, self._ctx)
+
+    @_montgomery_check
+    def __rsub__(self, other) -> "MontgomeryMod":
+        return -self + other
+
+    def __neg__(self) -> "MontgomeryMod":
+        if self.x == 0:
+            return _new(0, self._ctx)
+        return _new(self._ctx.n - self.x, self._ctx)
+
+    @_montgomery_check
+    def __mul__(self, other) -> "MontgomeryMod":
+        ctx = self._ctx
+        # Inlined Montgomery reduction, see _MontgomeryContext.reduce.
+        t = self.x * other.x
+        t = (t + (((t & ctx.mask) * ctx.n_prime) & ctx.mask) * ctx.n) >> ctx.bits
+        if t >= ctx.n:
+            t -= ctx.n
+        return _new(t, ctx)
+
+    @_montgomery_check
+    def __rmul__(self, other) -> "MontgomeryMod":
+        return self * other
+
+    def __bytes__(self):
+        return int(self).to_bytes((self.n.bit_length() + 7) // 8, byteorder="big")
+
+    def __int__(self):
+        return self._ctx.reduce(self.x)
+
+    def __eq__(self, other):
+        if type(other) is int:
+            return int(self) == (other % self.n)
+        if type(other) is not MontgomeryMod:
+            return False
+        return self.x == other.x and self._ctx.n == other._ctx.n
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        return str(int(self))
+
+    def __str__(self):
+        return str(int(self))
+
+    def __hash__(self):
+        return hash(("MontgomeryMod", self.x, self.n))
+
+    def __pow__(self, n, _=None) -> "MontgomeryMod":
+        if type(n) is not int:
+            raise TypeError
+        if n == 0:
+            return MontgomeryMod(1, self.n)
+        if n < 0:
+            return self.inverse() ** (-n)
+        if n == 1:
+            return _new(self.x, self._ctx)
+        if n == 2:
+            return self * self
+        return MontgomeryMod(pow(int(self), n, self.n), self.n)
+
+    def __getstate__(self):
+        return {"x": int(self), "n": self.n}
+
+    def __setstate__(self, state):
+        self._ctx = _montgomery_ctx(state["n"])
+        self.x = self._ctx.to_montgomery(state["x"])
+
+    def __getnewargs__(self):
+        return int(self), self.n
+
+
+from pyecsca.ec.mod.base import _mod_classes  # noqa
+
+_mod_classes["montgomery"] = MontgomeryMod
@@ -1,13 +1,14 @@
 """Provides curve model classes for the supported curve models."""
 
 from ast import parse, Expression, Module
+from functools import partial
 from typing import List, MutableMapping
 from importlib_resources import files, as_file
 from importlib_resources.abc import Traversable
 
 from public import public
 
-from pyecsca.ec.coordinates import EFDCoordinateModel, CoordinateModel
+from pyecsca.ec.coordinates import EFDCoordinateModel, CoordinateModel, _LazyMapping
 
 
 @public
@@ -45,7 +46,7 @@ class EFDCurveModel(CurveModel):
 
     def __load(self, efd_name: str):
         self.__class__._loaded = True  # skipcq: PYL-W0212
-        self.__class__.coordinates = {}
+        self.__class__.coordinates = _LazyMapping()
         self.__class__.parameter_names = []
         self.__class__.coordinate_names = []
         self.__class__.base_addition = []
@@ -57,12 +58,10 @@ class EFDCurveModel(CurveModel):
         self.__class__.from_weierstrass = []
 
         for entry in files("pyecsca.ec").joinpath("efd", efd_name).iterdir():
-            with as_file(entry) as file_path:
-                if entry.is_dir():
-                    self.__read_coordinate_dir(
-                        self.__class__, file_path, file_path.stem
-                    )
-                else:
+            if entry.is_dir():
+                self.__read_coordinate_dir(self.__class__, entry, entry.name)
+            else:
+                with as_file(entry) as file_path:
                     self.__read_curve_file(self.__class__, file_path)
 
     def __read_curve_file(self, cls, file_path: Traversable):
@@ -98,7 +97,14 @@ class EFDCurveModel(CurveModel):
                     cls.full_weierstrass.append(format_eq(line))
 
     def __read_coordinate_dir(self, cls, dir_path: Traversable, name: str):
-        cls.coordinates[name] = EFDCoordinateModel(dir_path, name, self)
+        # Only add the coordinate system to the manifest, it is loaded on first access.
+        cls.coordinates.add(name, partial(self.__load_coordinates, dir_path, name))
+
+    def __load_coordinates(
+        self, dir_path: Traversable, name: str
+    ) -> EFDCoordinateModel:
+        with as_file(dir_path) as file_path:
+            return EFDCoordinateModel(file_path, name, self)
 
     def __eq__(self, other):
         if not isinstance(other, EFDCurveModel):
@@ -109,9 +115,9 @@ class EFDCurveModel(CurveModel):
         return self.__dict__.copy()
 
     def __setstate__(self, state):
+        self.__dict__.update(state)
         if not self.__class__._loaded:
             self.__load(state["_efd_name"])
-        self.__dict__.update(state)
 
     def __hash__(self):
         return hash(self._efd_name)
@@ -2,15 +2,19 @@
 and actions used in them."""
 
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from copy import copy
 from enum import Enum
+from threading import Lock
 from public import public
-from typing import Mapping, Tuple, Optional, ClassVar, Set, Type
+from typing import Mapping, Tuple, Optional, ClassVar, Set, Type, Any, Hashable
 
+from pyecsca.ec import context
 from pyecsca.ec.context import ResultAction
 from pyecsca.ec.formula import Formula
 from pyecsca.ec.params import DomainParameters
 from pyecsca.ec.point import Point
+from pyecsca.misc.cfg import getconfig
 
 
 @public
@@ -242,9 +246,141 @@ class ScalarMultiplier(ABC):
         raise NotImplementedError
 
 
+@public
+class PrecomputationCache:
+    """
+    A bounded thread-safe LRU cache of the precomputed tables of :py:class:`PrecompMultiplier` instances.
+
+    The tables are keyed on the multiplier configuration, the domain parameters, the point,
+    the number of bits and the error-handling configuration.
+
+    :param maxsize: The maximum number of tables kept.
+    """
+
+    maxsize: int
+    """The maximum number of tables kept."""
+    hits: int
+    """The number of lookups that found a table."""
+    misses: int
+    """The number of lookups that did not find a table."""
+
+    def __init__(self, maxsize: int = 32):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Get the cached table under the key, if any.
+
+        :param key: The key.
+        :return: The table or ``None``.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: Hashable, entry: Any):
+        """
+        Store the table under the key, evicting the least recently used ones over the limit.
+
+        :param key: The key.
+        :param entry: The table.
+        """
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Clear the cache and its statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """The ratio of lookups that found a table."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(maxsize={self.maxsize}, size={len(self)}, hits={self.hits}, misses={self.misses})"
+
+
+# The cache of precomputed tables shared by all PrecompMultiplier instances.
+precomputation_cache: PrecomputationCache = PrecomputationCache()
+
+
 @public
 class PrecompMultiplier(ScalarMultiplier, ABC):
-    pass
+    """
+    A scalar multiplication algorithm that precomputes a table of points in :py:meth:`init`.
+
+    The precomputation is done in :py:meth:`_precompute` and traced as a :py:class:`PrecomputationAction`.
+    When no context is tracing the execution, the precomputed tables are shared between instances
+    of the same configuration via the :py:data:`precomputation_cache`
+    (see :py:attr:`pyecsca.misc.cfg.ECConfig.precomputation_cache`).
+    """
+
+    _precomputed: ClassVar[Tuple[str, ...]] = ("_points",)
+    """The names of the attributes that hold the precomputed table."""
+
+    def init(self, params: DomainParameters, point: Point, bits: Optional[int] = None):
+        with PrecomputationAction(params, point) as action:
+            super().init(params, point, bits)
+            ec = getconfig().ec
+            if not ec.precomputation_cache or context.current is not None:
+                action.exit(self._precompute())
+                return
+            key = (
+                self.__class__,
+                self,
+                params,
+                point,
+                self._bits,
+                ec.no_inverse_action,
+                ec.non_residue_action,
+                ec.unsatisfied_formula_assumption_action,
+            )
+            entry = precomputation_cache.get(key)
+            if entry is None:
+                result = self._precompute()
+                state = {
+                    name: getattr(self, name)
+                    for name in self._precomputed
+                    if hasattr(self, name)
+                }
+                # Key on a copy, so that a later change of the configuration of this instance does not alter it.
+                precomputation_cache.put(
+                    (key[0], copy(self)) + key[2:], (state, result)
+                )
+            else:
+                state, result = entry
+                for name, value in state.items():
+                    setattr(self, name, copy(value))
+            action.exit(result)
+
+    @abstractmethod
+    def _precompute(self) -> Any:
+        """
+        Precompute the table of points, the multiplier is already initialized.
+
+        :return: The result of the :py:class:`PrecomputationAction`.
+        """
+        raise NotImplementedError
 
 
 @public
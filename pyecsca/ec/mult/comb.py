@@ -11,11 +11,9 @@ from pyecsca.ec.mult import (
     ScalarMultiplier,
     ProcessingDirection,
     AccumulationOrder,
-    PrecomputationAction,
     ScalarMultiplicationAction,
     PrecompMultiplier,
 )
-from pyecsca.ec.params import DomainParameters
 from pyecsca.ec.point import Point
 from pyecsca.ec.scalar import convert_base
 
@@ -88,18 +86,16 @@ class BGMWMultiplier(AccumulatorMultiplier, PrecompMultiplier, ScalarMultiplier)
     def __repr__(self):
         return f"{self.__class__.__name__}({', '.join(map(str, self.formulas.values()))}, short_circuit={self.short_circuit}, width={self.width}, direction={self.direction.name}, accumulation_order={self.accumulation_order.name})"
 
-    def init(self, params: DomainParameters, point: Point, bits: Optional[int] = None):
-        with PrecomputationAction(params, point) as action:
-            super().init(params, point, bits)
-            d = ceil(self._bits / self.width)
-            self._points = {}
-            current_point = point
-            for i in range(d):
-                self._points[i] = current_point
-                if i != d - 1:
-                    for _ in range(self.width):
-                        current_point = self._dbl(current_point)
-            action.exit(self._points)
+    def _precompute(self):
+        d = ceil(self._bits / self.width)
+        self._points = {}
+        current_point = self._point
+        for i in range(d):
+            self._points[i] = current_point
+            if i != d - 1:
+                for _ in range(self.width):
+                    current_point = self._dbl(current_point)
+        return self._points
 
     def multiply(self, scalar: int) -> Point:
         if not self._initialized:
@@ -190,27 +186,25 @@ class CombMultiplier(AccumulatorMultiplier, PrecompMultiplier, ScalarMultiplier)
     def __repr__(self):
         return f"{self.__class__.__name__}({', '.join(map(str, self.formulas.values()))}, short_circuit={self.short_circuit}, width={self.width}, accumulation_order={self.accumulation_order.name}, always={self.always})"
 
-    def init(self, params: DomainParameters, point: Point, bits: Optional[int] = None):
-        with PrecomputationAction(params, point) as action:
-            super().init(params, point, bits)
-            d = ceil(self._bits / self.width)
-            base_points = {}
-            current_point = point
+    def _precompute(self):
+        d = ceil(self._bits / self.width)
+        base_points = {}
+        current_point = self._point
+        for i in range(self.width):
+            base_points[i] = current_point
+            if i != self.width - 1:
+                for _ in range(d):
+                    current_point = self._dbl(current_point)
+        self._points = {}
+        for j in range(1, 2**self.width):
+            points = []
             for i in range(self.width):
-                base_points[i] = current_point
-                if i != self.width - 1:
-                    for _ in range(d):
-                        current_point = self._dbl(current_point)
-            self._points = {}
-            for j in range(1, 2**self.width):
-                points = []
-                for i in range(self.width):
-                    if j & (1 << i):
-                        points.append(base_points[i])
-                self._points[j] = points[0]
-                for other in points[1:]:
-                    self._points[j] = self._accumulate(self._points[j], other)
-            action.exit(self._points)
+                if j & (1 << i):
+                    points.append(base_points[i])
+            self._points[j] = points[0]
+            for other in points[1:]:
+                self._points[j] = self._accumulate(self._points[j], other)
+        return self._points
 
     def multiply(self, scalar: int) -> Point:
         if not self._initialized:
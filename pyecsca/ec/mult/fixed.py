@@ -11,11 +11,9 @@ from pyecsca.ec.mult.base import (
     ScalarMultiplier,
     ProcessingDirection,
     AccumulationOrder,
-    PrecomputationAction,
     ScalarMultiplicationAction,
     PrecompMultiplier,
 )
-from pyecsca.ec.params import DomainParameters
 from pyecsca.ec.point import Point
 
 
@@ -94,16 +92,14 @@ class FullPrecompMultiplier(AccumulatorMultiplier, PrecompMultiplier, ScalarMult
     def __repr__(self):
         return f"{self.__class__.__name__}({', '.join(map(str, self.formulas.values()))}, short_circuit={self.short_circuit}, accumulation_order={self.accumulation_order.name}, always={self.always}, complete={self.complete})"
 
-    def init(self, params: DomainParameters, point: Point, bits: Optional[int] = None):
-        with PrecomputationAction(params, point) as action:
-            super().init(params, point, bits)
-            self._points = {}
-            current_point = point
-            for i in range(self._bits + 1):
-                self._points[i] = current_point
-                if i != self._bits:
-                    current_point = self._dbl(current_point)
-            action.exit(self._points)
+    def _precompute(self):
+        self._points = {}
+        current_point = self._point
+        for i in range(self._bits + 1):
+            self._points[i] = current_point
+            if i != self._bits:
+                current_point = self._dbl(current_point)
+        return self._points
 
     def _ltr(self, scalar: int) -> Point:
         if self.complete:
@@ -9,7 +9,6 @@ from pyecsca.ec.mult.base import (
     ScalarMultiplicationAction,
     ProcessingDirection,
     AccumulationOrder,
-    PrecomputationAction,
     AccumulatorMultiplier,
     PrecompMultiplier,
 )
@@ -19,7 +18,6 @@ from pyecsca.ec.formula import (
     ScalingFormula,
     NegationFormula,
 )
-from pyecsca.ec.params import DomainParameters
 from pyecsca.ec.point import Point
 from pyecsca.ec.scalar import naf, wnaf
 
@@ -48,6 +46,7 @@ class BinaryNAFMultiplier(AccumulatorMultiplier, PrecompMultiplier, ScalarMultip
     complete: bool
     """Whether it starts processing at full order-bit-length."""
     _point_neg: Point
+    _precomputed = ("_point_neg",)
 
     def __init__(
         self,
@@ -100,11 +99,9 @@ class BinaryNAFMultiplier(AccumulatorMultiplier, PrecompMultiplier, ScalarMultip
     def __repr__(self):
         return f"{self.__class__.__name__}({', '.join(map(str, self.formulas.values()))}, short_circuit={self.short_circuit}, direction={self.direction.name}, accumulation_order={self.accumulation_order.name}, always={self.always}, complete={self.complete})"
 
-    def init(self, params: DomainParameters, point: Point, bits: Optional[int] = None):
-        with PrecomputationAction(params, point) as action:
-            super().init(params, point, bits)
-            self._point_neg = self._neg(point)
-            action.exit({-1: self._point_neg})
+    def _precompute(self):
+        self._point_neg = self._neg(self._point)
+        return {-1: self._point_neg}
 
     def _ltr(self, scalar_naf: List[int]) -> Point:
         if self.complete:
@@ -201,6 +198,7 @@ class WindowNAFMultiplier(AccumulatorMultiplier, PrecompMultiplier, ScalarMultip
     optionals = {ScalingFormula}
     _points: MutableMapping[int, Point]
     _points_neg: MutableMapping[int, Point]
+    _precomputed = ("_points", "_points_neg")
     precompute_negation: bool = False
     """Whether to precompute the negation of the precomputed points as well."""
     width: int
@@ -259,23 +257,21 @@ class WindowNAFMultiplier(AccumulatorMultiplier, PrecompMultiplier, ScalarMultip
     def __repr__(self):
         return f"{self.__class__.__name__}({', '.join(map(str, self.formulas.values()))}, short_circuit={self.short_circuit}, width={self.width}, precompute_negation={self.precompute_negation}, accumulation_order={self.accumulation_order.name}, complete={self.complete})"
 
-    def init(self, params: DomainParameters, point: Point, bits: Optional[int] = None):
-        with PrecomputationAction(params, point) as action:
-            super().init(params, point, bits)
-            self._points = {}
-            self._points_neg = {}
-            current_point = point
-            double_point = self._dbl(point)
-            for i in range(0, 2 ** (self.width - 2)):
-                self._points[2 * i + 1] = current_point
-                if self.precompute_negation:
-                    self._points_neg[2 * i + 1] = self._neg(current_point)
-                if i != 2 ** (self.width - 2) - 1:
-                    current_point = self._add(current_point, double_point)
-            result = {**self._points}
+    def _precompute(self):
+        self._points = {}
+        self._points_neg = {}
+        current_point = self._point
+        double_point = self._dbl(self._point)
+        for i in range(0, 2 ** (self.width - 2)):
+            self._points[2 * i + 1] = current_point
             if self.precompute_negation:
-                result.update({-k: v for k, v in self._points_neg.items()})
-            action.exit(result)
+                self._points_neg[2 * i + 1] = self._neg(current_point)
+            if i != 2 ** (self.width - 2) - 1:
+                current_point = self._add(current_point, double_point)
+        result = {**self._points}
+        if self.precompute_negation:
+            result.update({-k: v for k, v in self._points_neg.items()})
+        return result
 
     def multiply(self, scalar: int) -> Point:
         if not self._initialized:
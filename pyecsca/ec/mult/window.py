@@ -4,12 +4,10 @@ from copy import copy
 from typing import Optional, MutableMapping
 from public import public
 
-from pyecsca.ec.params import DomainParameters
 from pyecsca.ec.mult.base import (
     ScalarMultiplier,
     AccumulationOrder,
     ScalarMultiplicationAction,
-    PrecomputationAction,
     ProcessingDirection,
     AccumulatorMultiplier,
     PrecompMultiplier,
@@ -96,17 +94,15 @@ class SlidingWindowMultiplier(
     def __repr__(self):
         return f"{self.__class__.__name__}({', '.join(map(str, self.formulas.values()))}, short_circuit={self.short_circuit}, width={self.width}, recoding_direction={self.recoding_direction.name}, accumulation_order={self.accumulation_order.name})"
 
-    def init(self, params: DomainParameters, point: Point, bits: Optional[int] = None):
-        with PrecomputationAction(params, point) as action:
-            super().init(params, point, bits)
-            self._points = {}
-            current_point = point
-            double_point = self._dbl(point)
-            for i in range(0, 2 ** (self.width - 1)):
-                self._points[2 * i + 1] = current_point
-                if i != 2 ** (self.width - 1) - 1:
-                    current_point = self._add(current_point, double_point)
-            action.exit(self._points)
+    def _precompute(self):
+        self._points = {}
+        current_point = self._point
+        double_point = self._dbl(self._point)
+        for i in range(0, 2 ** (self.width - 1)):
+            self._points[2 * i + 1] = current_point
+            if i != 2 ** (self.width - 1) - 1:
+                current_point = self._add(current_point, double_point)
+        return self._points
 
     def multiply(self, scalar: int) -> Point:
         if not self._initialized:
@@ -197,16 +193,15 @@ class FixedWindowLTRMultiplier(
     def __repr__(self):
         return f"{self.__class__.__name__}({', '.join(map(str, self.formulas.values()))}, short_circuit={self.short_circuit}, m={self.m}, accumulation_order={self.accumulation_order.name})"
 
-    def init(self, params: DomainParameters, point: Point, bits: Optional[int] = None):
-        with PrecomputationAction(params, point) as action:
-            super().init(params, point, bits)
-            double_point = self._dbl(point)
-            self._points = {1: point, 2: double_point}
-            current_point = double_point
-            for i in range(3, self.m):
-                current_point = self._add(current_point, point)
-                self._points[i] = current_point
-            action.exit(self._points)
+    def _precompute(self):
+        point = self._point
+        double_point = self._dbl(point)
+        self._points = {1: point, 2: double_point}
+        current_point = double_point
+        for i in range(3, self.m):
+            current_point = self._add(current_point, point)
+            self._points[i] = current_point
+        return self._points
 
     def _mult_m(self, point: Point) -> Point:
         if self.m & (self.m - 1) == 0:
@@ -258,6 +253,7 @@ class WindowBoothMultiplier(AccumulatorMultiplier, PrecompMultiplier, ScalarMult
     optionals = {ScalingFormula}
     _points: MutableMapping[int, Point]
     _points_neg: MutableMapping[int, Point]
+    _precomputed = ("_points", "_points_neg")
     precompute_negation: bool = False
     """Whether to precompute the negation of the precomputed points as well."""
     width: int
@@ -310,23 +306,22 @@ class WindowBoothMultiplier(AccumulatorMultiplier, PrecompMultiplier, ScalarMult
     def __repr__(self):
         return f"{self.__class__.__name__}({', '.join(map(str, self.formulas.values()))}, short_circuit={self.short_circuit}, width={self.width}, precompute_negation={self.precompute_negation}, accumulation_order={self.accumulation_order.name})"
 
-    def init(self, params: DomainParameters, point: Point, bits: Optional[int] = None):
-        with PrecomputationAction(params, point) as action:
-            super().init(params, point, bits)
-            double_point = self._dbl(point)
-            self._points = {1: point, 2: double_point}
+    def _precompute(self):
+        point = self._point
+        double_point = self._dbl(point)
+        self._points = {1: point, 2: double_point}
+        if self.precompute_negation:
+            self._points_neg = {1: self._neg(point), 2: self._neg(double_point)}
+        current_point = double_point
+        for i in range(3, 2 ** (self.width - 1) + 1):
+            current_point = self._add(current_point, point)
+            self._points[i] = current_point
             if self.precompute_negation:
-                self._points_neg = {1: self._neg(point), 2: self._neg(double_point)}
-            current_point = double_point
-            for i in range(3, 2 ** (self.width - 1) + 1):
-                current_point = self._add(current_point, point)
-                self._points[i] = current_point
-                if self.precompute_negation:
-                    self._points_neg[i] = self._neg(current_point)
-            result = {**self._points}
-            if self.precompute_negation:
-                result.update({-k: v for k, v in self._points_neg.items()})
-            action.exit(result)
+                self._points_neg[i] = self._neg(current_point)
+        result = {**self._points}
+        if self.precompute_negation:
+            result.update({-k: v for k, v in self._points_neg.items()})
+        return result
 
     def multiply(self, scalar: int) -> Point:
         if not self._initialized:
@@ -16,6 +16,9 @@ from ast import (
     operator as ast_operator,
     unaryop as ast_unaryop,
     USub,
+    NodeTransformer,
+    Call,
+    Load,
 )
 from enum import Enum
 from types import CodeType
@@ -28,6 +31,33 @@ from pyecsca.ec.mod import Mod
 from pyecsca.misc.utils import pexec
 
 
+class _InversionTransformer(NodeTransformer):
+    # Replace divisions and negative powers in op expressions by calls `_inv_(x, _field_)` to an inversion function,
+    # which can then invert many values at once (the batch formula execution or the batch affine mapping).
+
+    def visit_BinOp(self, node: BinOp) -> Any:
+        self.generic_visit(node)
+        if isinstance(node.op, Div):
+            return BinOp(left=node.left, op=Mult(), right=self.__inverse(node.right))
+        if (
+            isinstance(node.op, Pow)
+            and isinstance(node.right, UnaryOp)
+            and isinstance(node.right.op, USub)
+        ):
+            return self.__inverse(
+                BinOp(left=node.left, op=Pow(), right=node.right.operand)
+            )
+        return node
+
+    @staticmethod
+    def __inverse(node: Any) -> Call:
+        return Call(
+            func=Name(id="_inv_", ctx=Load()),
+            args=[node, Name(id="_field_", ctx=Load())],
+            keywords=[],
+        )
+
+
 @public
 class OpType(Enum):
     """Type of binary and unary operators."""
@@ -59,17 +89,70 @@ class CodeOp:
     """The variables used in the operation (e.g. `X1`, `Z2`)."""
     constants: FrozenSet[int]  # TODO: Might not be only int? See issue in Formula eval.
     """The constants used in the operation."""
-    code: Module
-    """The code of the operation."""
     operator: OpType
     """The operator type that executes in the operation."""
-    compiled: CodeType
-    """The compiled code of the operation."""
+    _code: Optional[Module]
+    _compiled: Optional[CodeType]
+    _source: str
 
     def __init__(self, code: Module):
         self.code = code
         self.__parse(code)
 
+    @property
+    def code(self) -> Module:
+        """The code of the operation."""
+        if self._code is None:
+            self._code = pexec(self._source)
+        return self._code
+
+    @code.setter
+    def code(self, code: Module):
+        self._code = code
+
+    @property
+    def compiled(self) -> CodeType:
+        """The compiled code of the operation."""
+        if self._compiled is None:
+            self._compiled = compile(self.code, "", mode="exec")
+        return self._compiled
+
+    def _record(self) -> Tuple[Any, ...]:
+        # The parsed operation as a tuple that can be marshalled, see :py:meth:`_from_record`.
+        return (
+            unparse(self.code).strip(),
+            self.result,
+            tuple(sorted(self.parameters)),
+            tuple(sorted(self.variables)),
+            tuple(self.constants),
+            self.left,
+            self.right,
+            self.operator.name,
+        )
+
+    @classmethod
+    def _from_record(cls, record: Tuple[Any, ...]) -> "CodeOp":
+        # Construct the operation from a record, without parsing nor compiling its code.
+        # The code is parsed and compiled lazily from its source, only when it is accessed.
+        op = object.__new__(cls)
+        (
+            op._source,
+            op.result,
+            parameters,
+            variables,
+            constants,
+            op.left,
+            op.right,
+            operator,
+        ) = record
+        op._code = None
+        op._compiled = None
+        op.parameters = frozenset(parameters)
+        op.variables = frozenset(variables)
+        op.constants = frozenset(constants)
+        op.operator = OpType[operator]
+        return op
+
     def __parse(self, code: Module):
         assign = cast(Assign, code.body[0])
         self.result = cast(Name, assign.targets[0]).id
@@ -103,7 +186,7 @@ class CodeOp:
         self.parameters = frozenset(params)
         self.variables = frozenset(variables)
         self.constants = frozenset(constants)  # type: ignore  # (known issue)
-        self.compiled = compile(self.code, "", mode="exec")
+        self._compiled = compile(self.code, "", mode="exec")
 
     def __to_name(self, node):
         if isinstance(node, Name):
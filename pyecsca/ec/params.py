@@ -6,12 +6,14 @@ It also provides a domain parameter class and a class for a whole category of do
 
 import json
 import csv
+from functools import lru_cache
 from sympy import Poly, FF, symbols
 from astunparse import unparse
 from io import RawIOBase, BufferedIOBase
 from pathlib import Path
-from typing import Optional, Dict, Union, BinaryIO, List, Callable, IO
+from typing import Optional, Dict, Union, BinaryIO, List, Callable, IO, Any, Tuple
 from importlib_resources import files
+from importlib_resources.abc import Traversable
 
 from public import public
 
@@ -425,6 +427,58 @@ def load_params_ectester(
     return _create_params(curve_dict, coords, infty)
 
 
+@lru_cache(maxsize=None)
+def _std_categories() -> Dict[str, Traversable]:
+    # The categories in the std-curves database, by name.
+    return {
+        entry.name: entry
+        for entry in files("pyecsca.ec").joinpath("std").iterdir()
+        if entry.is_dir()
+    }
+
+
+@lru_cache(maxsize=None)
+def _std_category(category: str) -> Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]:
+    # The parsed category from the std-curves database and an index of its curve records by name.
+    categories = _std_categories()
+    if category not in categories:
+        raise ValueError(f"Category {category} not found.")
+    with categories[category].joinpath("curves.json").open("rb") as f:
+        category_json = json.load(f)
+    index = {}
+    for curve in category_json["curves"]:
+        index.setdefault(curve["name"], curve)
+    return category_json, index
+
+
+@lru_cache(maxsize=256)
+def _std_params(
+    category: str,
+    name: str,
+    coords: str,
+    infty: bool,
+    mod_implementation: str,
+    assumption_action: str,
+) -> DomainParameters:
+    # The config is a part of the key, as the parameters depend on it.
+    _, index = _std_category(category)
+    if name not in index:
+        raise ValueError(f"Curve {name} not found in category {category}.")
+    return _create_params(index[name], coords, infty)
+
+
+def _get_params(category: str, name: str, coords: str, infty: bool) -> DomainParameters:
+    cfg = getconfig().ec
+    return _std_params(
+        category,
+        name,
+        coords,
+        infty,
+        cfg.mod_implementation,
+        cfg.unsatisfied_coordinate_assumption_action,
+    )
+
+
 @public
 def get_category(
     category: str,
@@ -434,6 +488,8 @@ def get_category(
     """
     Retrieve a category from the std-curves database at https://github.com/J08nY/std-curves.
 
+    The curves are memoized like those in :py:func:`get_params`.
+
     :param category: The category to retrieve.
     :param coords: The name of the coordinate system to use. Can be a callable that takes
                    as argument the name of the curve and produces the coordinate system to use for that curve.
@@ -442,15 +498,17 @@ def get_category(
                   as argument the name of the curve and returns the infinity option to use for that curve.
     :return: The category.
     """
-    categories = {
-        entry.name: entry
-        for entry in files("pyecsca.ec").joinpath("std").iterdir()
-        if entry.is_dir()
-    }
-    if category not in categories:
-        raise ValueError(f"Category {category} not found.")
-    with categories[category].joinpath("curves.json").open("rb") as f:
-        return load_category(f, coords, infty)
+    category_json, _ = _std_category(category)
+    curves = []
+    for curve_data in category_json["curves"]:
+        curve_coords = coords(curve_data["name"]) if callable(coords) else coords
+        curve_infty = infty(curve_data["name"]) if callable(infty) else infty
+        try:
+            curve = _get_params(category, curve_data["name"], curve_coords, curve_infty)
+        except ValueError:
+            continue
+        curves.append(curve)
+    return DomainParameterCategory(category_json["name"], category_json["desc"], curves)
 
 
 @public
@@ -461,6 +519,9 @@ def get_params(
     Retrieve a curve from a set of stored parameters.
 
     Uses the std-curves database at https://github.com/J08nY/std-curves.
+    The database is parsed and indexed once and the resulting domain parameters are memoized
+    (per category, name, coordinate system, `infty` and the relevant config), so repeated calls
+    return the same object, which should not be modified.
 
     :param category: The category of the curve.
     :param name: The name of the curve.
@@ -469,23 +530,7 @@ def get_params(
                   point at infinity of the coordinate system.
     :return: The curve.
     """
-    categories = {
-        entry.name: entry
-        for entry in files("pyecsca.ec").joinpath("std").iterdir()
-        if entry.is_dir()
-    }
-    if category not in categories:
-        raise ValueError(f"Category {category} not found.")
-    with categories[category].joinpath("curves.json").open("rb") as f:
-        category_json = json.load(f)
-    curve = None
-    for curve in category_json["curves"]:
-        if curve["name"] == name:
-            break
-    else:
-        raise ValueError(f"Curve {name} not found in category {category}.")  # noqa
-
-    return _create_params(curve, coords, infty)
+    return _get_params(category, name, coords, infty)
 
 
 _dirs = list(files("pyecsca.ec").joinpath("std").iterdir())
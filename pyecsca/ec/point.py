@@ -1,16 +1,36 @@
 """Provides a :py:class:`.Point` class and a special :py:class:`.InfinityPoint` class for the point at infinity."""
 
-from copy import copy
+from ast import Expression, Call, Name, walk, fix_missing_locations
+from copy import copy, deepcopy
+from functools import lru_cache
 from operator import itemgetter
-from typing import Mapping, Set, TYPE_CHECKING
+from types import CodeType
+from typing import (
+    Mapping,
+    Set,
+    TYPE_CHECKING,
+    Sequence,
+    List,
+    Any,
+    Dict,
+    Tuple,
+    Callable,
+)
 
 from public import public
 
 from pyecsca.ec.context import ResultAction
 from pyecsca.ec.coordinates import AffineCoordinateModel, CoordinateModel
-from pyecsca.ec.mod import Mod, Undefined, mod, square_roots, cube_roots
+from pyecsca.ec.mod import (
+    Mod,
+    Undefined,
+    mod,
+    square_roots,
+    cube_roots,
+    batch_inverse,
+)
 from pyecsca.ec.error import NonResidueError
-from pyecsca.ec.op import CodeOp
+from pyecsca.ec.op import CodeOp, _InversionTransformer
 
 
 if TYPE_CHECKING:
@@ -39,11 +59,17 @@ class CoordinateMappingAction(ResultAction):
 
 @public
 class Point:
-    """A point with coordinates in a coordinate model."""
+    """
+    A point with coordinates in a coordinate model.
+
+    The coordinates are stored in a tuple ordered as the variables of the coordinate model,
+    they are accessible as a mapping via :py:attr:`coords` or as attributes (`point.X`).
+    """
 
     coordinate_model: CoordinateModel
-    coords: Mapping[str, Mod]
     field: int
+    _values: Tuple[Mod, ...]
+    __slots__ = ("coordinate_model", "field", "_values")
 
     def __init__(self, model: CoordinateModel, **coords: Mod):
         if not set(model.variables) == set(coords.keys()):
@@ -51,9 +77,9 @@ class Point:
                 f"Wrong coordinate values for coordinate model, expected {model.variables} got {coords.keys()}."
             )
         self.coordinate_model = model
-        self.coords = coords
+        self._values = tuple(coords[variable] for variable in model.variables)
         field = None
-        for value in self.coords.values():
+        for value in self._values:
             if field is None:
                 field = value.n
             else:
@@ -63,13 +89,33 @@ class Point:
                     )
         self.field = field if field is not None else 0
 
-    def __getattribute__(self, name):
-        # Do the magic such that point.X1 works!
-        if "coords" in super().__getattribute__("__dict__"):
-            coords = super().__getattribute__("coords")
-            if name in coords:
-                return coords[name]
-        return super().__getattribute__(name)
+    @classmethod
+    def _trusted(
+        cls, model: CoordinateModel, values: Tuple[Mod, ...], field: int
+    ) -> "Point":
+        # Construct a point without validation, the values need to be ordered as the variables
+        # of the model and be over the field (like the outputs of a formula).
+        point = object.__new__(cls)
+        point.coordinate_model = model
+        point._values = values
+        point.field = field
+        return point
+
+    @property
+    def coords(self) -> Mapping[str, Mod]:
+        """The coordinates of the point, as a mapping from the variables of the coordinate model."""
+        return dict(zip(self.coordinate_model.variables, self._values))
+
+    def __getattr__(self, name):
+        # Do the magic such that point.X1 works! Only called if the normal lookup fails.
+        if name in Point.__slots__:
+            raise AttributeError(name)
+        try:
+            return self._values[self.coordinate_model.variables.index(name)]
+        except ValueError:
+            raise AttributeError(
+                f"'{self.__class__.__name__}' object has no attribute '{name}'"
+            ) from None
 
     def to_affine(self) -> "Point":
         """Convert this point into the affine coordinate model, if possible."""
@@ -79,12 +125,7 @@ class Point:
         ) as action:
             if isinstance(self.coordinate_model, AffineCoordinateModel):
                 return action.exit(copy(self))
-            ops = []
-            for s in self.coordinate_model.satisfying:
-                try:
-                    ops.append(CodeOp(s))
-                except Exception:
-                    pass
+            ops = _affine_mapping(self.coordinate_model).ops
             result_variables = set(map(lambda x: x.result, ops))
             if not result_variables.issuperset(affine_model.variables):
                 raise NotImplementedError(
@@ -104,6 +145,55 @@ class Point:
                     result[op.result] = locls[op.result]
             return action.exit(Point(affine_model, **result))
 
+    @staticmethod
+    def batch_to_affine(points: Sequence["Point"]) -> List["Point"]:
+        """
+        Convert many points into the affine coordinate model at once, if possible.
+
+        The inversions needed by the mapping are shared among all of the points with
+        the same coordinate model and field, using :py:func:`~pyecsca.ec.mod.batch_inverse`.
+        Otherwise, the results (and errors) are the same as those of :py:meth:`to_affine`.
+
+        :param points: The points to convert.
+        :return: The affine points, in the same order.
+        """
+        results: List[Any] = [None] * len(points)
+        groups: Dict[Tuple[CoordinateModel, int], List[int]] = {}
+        for i, point in enumerate(points):
+            if isinstance(point, InfinityPoint) or isinstance(
+                point.coordinate_model, AffineCoordinateModel
+            ):
+                results[i] = point.to_affine()
+            elif not _affine_mapping(point.coordinate_model).batchable:
+                results[i] = point.to_affine()
+            else:
+                groups.setdefault((point.coordinate_model, point.field), []).append(i)
+        for (coordinate_model, field), indices in groups.items():
+            affine_model = AffineCoordinateModel(coordinate_model.curve_model)
+            mapping = _affine_mapping(coordinate_model)
+            # First, collect the values to invert (these do not depend on any inverted ones).
+            to_invert: List[Mod] = []
+
+            def collect(value, _):
+                to_invert.append(value)
+                return mod(1, field)
+
+            for i in indices:
+                mapping.execute(points[i], collect)
+            inverses = iter(batch_inverse(to_invert))
+            # Then, compute the mapping with the inverses.
+            for i in indices:
+                point = points[i]
+                with CoordinateMappingAction(
+                    coordinate_model, affine_model, point
+                ) as action:
+                    locls = mapping.execute(point, lambda value, _: next(inverses))
+                    result = {
+                        variable: locls[variable] for variable in affine_model.variables
+                    }
+                    results[i] = action.exit(Point(affine_model, **result))
+        return results
+
     def to_model(
         self,
         coordinate_model: CoordinateModel,
@@ -243,16 +333,18 @@ class Point:
         return self.equals_affine(other)
 
     def __iter__(self):
-        for k in sorted(self.coords.keys()):
-            yield self.coords[k]
+        coords = self.coords
+        for k in sorted(coords.keys()):
+            yield coords[k]
 
     def __len__(self):
-        return len(self.coords)
+        return len(self._values)
 
     def __bytes__(self):
         res = b"\x04"
-        for k in sorted(self.coords.keys()):
-            res += bytes(self.coords[k])
+        coords = self.coords
+        for k in sorted(coords.keys()):
+            res += bytes(coords[k])
         return res
 
     def __eq__(self, other):
@@ -260,19 +352,24 @@ class Point:
             return False
         if self.coordinate_model != other.coordinate_model:
             return False
-        return self.coords == other.coords
+        return self._values == other._values
 
     def __hash__(self):
         return hash(
             (
                 self.coordinate_model,
-                tuple(self.coords.keys()),
-                tuple(self.coords.values()),
+                tuple(self.coordinate_model.variables),
+                self._values,
             )
         )
 
     def __str__(self):
-        args = ", ".join([f"{key}={val}" for key, val in self.coords.items()])
+        args = ", ".join(
+            [
+                f"{key}={val}"
+                for key, val in zip(self.coordinate_model.variables, self._values)
+            ]
+        )
         return f"[{args}]"
 
     def __repr__(self):
@@ -283,6 +380,8 @@ class Point:
 class InfinityPoint(Point):
     """A point at infinity."""
 
+    __slots__ = ()
+
     def __init__(self, model: CoordinateModel):
         coords = {key: Undefined() for key in model.variables}
         super().__init__(model, **coords)
@@ -333,3 +432,74 @@ class InfinityPoint(Point):
 
     def __repr__(self):
         return f"InfinityPoint({self.coordinate_model})"
+
+
+class _AffineMapping:
+    """The ops mapping points in a coordinate model into the affine one."""
+
+    ops: List[CodeOp]
+    """The ops of the mapping."""
+    inverting: List[Tuple[str, CodeType]]
+    """The ops of the mapping, with the inversions done by an `_inv_` function."""
+    affine_variables: Set[str]
+    """The variables of the affine coordinate model."""
+    batchable: bool
+    """Whether the mapping is complete and the values to invert do not depend on other inverted values."""
+
+    def __init__(self, coordinate_model: CoordinateModel):
+        self.ops = []
+        for s in coordinate_model.satisfying:
+            try:
+                self.ops.append(CodeOp(s))
+            except Exception:
+                pass
+        self.affine_variables = set(
+            AffineCoordinateModel(coordinate_model.curve_model).variables
+        )
+        self.inverting = []
+        self.batchable = {op.result for op in self.ops}.issuperset(
+            self.affine_variables
+        )
+        transformer = _InversionTransformer()
+        tainted: Set[str] = set()
+        for op in self.ops:
+            expr = transformer.visit(deepcopy(op.code.body[0].value))
+            inverted = set()
+            for node in walk(expr):
+                if isinstance(node, Call):
+                    inverted.update(
+                        name.id for name in walk(node.args[0]) if isinstance(name, Name)
+                    )
+            if inverted & tainted:
+                self.batchable = False
+            names = {node.id for node in walk(expr) if isinstance(node, Name)}
+            if inverted or names & tainted:
+                tainted.add(op.result)
+            self.inverting.append(
+                (
+                    op.result,
+                    compile(fix_missing_locations(Expression(body=expr)), "", "eval"),
+                )
+            )
+
+    def execute(
+        self, point: "Point", inverse: Callable[[Mod, int], Mod]
+    ) -> Dict[str, Any]:
+        """Execute the mapping on the point, with the given inversion function."""
+        locls: Dict[str, Any] = {
+            **point.coords,
+            "_inv_": inverse,
+            "_field_": point.field,
+        }
+        for result, code in self.inverting:
+            try:
+                locls[result] = eval(code, None, locls)  # eval is OK here, skipcq: PYL-W0123
+            except NameError as e:
+                if result in self.affine_variables:
+                    raise e
+        return locls
+
+
+@lru_cache
+def _affine_mapping(coordinate_model: CoordinateModel) -> _AffineMapping:
+    return _AffineMapping(coordinate_model)
@@ -4,6 +4,7 @@ Provides functions for runtime configuration of the toolkit.
 This includes how errors are handled, or which :py:class:`~pyecsca.ec.mod.Mod` implementation is used.
 """
 
+import os
 from copy import deepcopy
 from contextvars import ContextVar, Token
 from typing import Optional
@@ -20,6 +21,19 @@ class ECConfig:
     _unsatisfied_formula_assumption_action: str = "error"
     _unsatisfied_coordinate_assumption_action: str = "error"
     _mod_implementation: str = "gmp"
+    _formula_compilation: bool = True
+    _precomputation_cache: bool = True
+    _efd_cache: Optional[str] = (
+        os.environ.get(
+            "PYECSCA_EFD_CACHE",
+            os.path.join(
+                os.environ.get("XDG_CACHE_HOME")
+                or os.path.join(os.path.expanduser("~"), ".cache"),
+                "pyecsca",
+            ),
+        )
+        or None
+    )
 
     @property
     def no_inverse_action(self) -> str:
@@ -113,18 +127,65 @@ class ECConfig:
          - ``"gmp"``: Requires the GMP library and `gmpy2` package.
          - ``"flint"``: Requires the flint library and `python-flint` package.
          - ``"python"``: Doesn't require anything.
+         - ``"montgomery"``: Doesn't require anything, keeps elements in the Montgomery form.
          - ``"symbolic"``: Requires sympy.
         """
         return self._mod_implementation
 
     @mod_implementation.setter
     def mod_implementation(self, value: str):
-        if value not in ("python", "gmp", "flint", "symbolic"):
+        if value not in ("python", "gmp", "flint", "montgomery", "symbolic"):
             raise ValueError(
-                "Bad Mod implementaiton, can be one of 'python', 'gmp', 'flint' or 'symbolic'."
+                "Bad Mod implementaiton, can be one of 'python', 'gmp', 'flint', 'montgomery' or 'symbolic'."
             )
         self._mod_implementation = value
 
+    @property
+    def formula_compilation(self) -> bool:
+        """
+        Return or set whether formulas are executed as a single compiled function.
+
+        The compiled function is only used when no context is tracing the execution
+        (i.e. :py:data:`pyecsca.ec.context.current` is ``None`` or a :py:class:`pyecsca.ec.context.CountingContext`),
+        otherwise the formula is executed op-by-op and a :py:class:`pyecsca.ec.formula.base.FormulaAction` is recorded.
+        """
+        return self._formula_compilation
+
+    @formula_compilation.setter
+    def formula_compilation(self, value: bool):
+        self._formula_compilation = bool(value)
+
+    @property
+    def precomputation_cache(self) -> bool:
+        """
+        Return or set whether the precomputed tables of multipliers are shared via a cache.
+
+        The cache (:py:data:`pyecsca.ec.mult.base.precomputation_cache`) is only used when no context
+        is tracing the execution (i.e. :py:data:`pyecsca.ec.context.current` is ``None``), otherwise
+        the precomputation is always performed and traced.
+        """
+        return self._precomputation_cache
+
+    @precomputation_cache.setter
+    def precomputation_cache(self, value: bool):
+        self._precomputation_cache = bool(value)
+
+    @property
+    def efd_cache(self) -> Optional[str]:
+        """
+        Return or set the directory of the on-disk cache of parsed [EFD]_ formulas.
+
+        The parsed formulas of a coordinate system are stored there when it is first loaded and
+        loaded from there afterwards, as long as the [EFD]_ data files did not change. ``None``
+        disables the cache. The default is taken from the ``PYECSCA_EFD_CACHE`` environment variable
+        (empty to disable), otherwise it is the ``pyecsca`` directory in the user cache directory.
+        """
+        return self._efd_cache
+
+    @efd_cache.setter
+    def efd_cache(self, value: Optional[str]):
+        self._efd_cache = value if value else None
+
 
 @public
 class LoggingConfig:
@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+import os
+import sys
+from subprocess import run
+from tempfile import TemporaryDirectory
+
+import click
+
+from test.utils import RawTimer
+
+LOAD_ALL = """
+from pyecsca.ec.model import ShortWeierstrassModel, MontgomeryModel, EdwardsModel, TwistedEdwardsModel
+for model in (ShortWeierstrassModel, MontgomeryModel, EdwardsModel, TwistedEdwardsModel):
+    model()
+"""
+
+
+def load_time(cache, operations):
+    env = dict(os.environ)
+    env["PYECSCA_EFD_CACHE"] = cache
+    timer = RawTimer()
+    with timer:
+        for _ in range(operations):
+            run([sys.executable, "-c", LOAD_ALL], env=env, check=True)
+    return timer.duration / operations
+
+
+@click.command()
+@click.option("-o", "--operations", type=click.INT, default=5)
+def main(operations):
+    click.echo(
+        f"Timing {operations} imports and loads of all of the EFD curve models (in fresh processes)..."
+    )
+    with TemporaryDirectory() as cache_dir:
+        # Baseline: The Python startup and the import without any EFD loading.
+        baseline = RawTimer()
+        with baseline:
+            for _ in range(operations):
+                run([sys.executable, "-c", "import pyecsca.ec.model"], check=True)
+        click.echo(f"import only:   {baseline.duration / operations:.4f}s")
+        click.echo(f"without cache: {load_time('', operations):.4f}s")
+        click.echo(f"cold cache:    {load_time(cache_dir, 1):.4f}s")
+        click.echo(f"warm cache:    {load_time(cache_dir, operations):.4f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -32,8 +32,17 @@ from test.utils import Profiler
     envvar="DIR",
 )
 def main(profiler, mod, operations, directory):
+    for compilation in (True, False):
+        path = "compiled" if compilation else "traced"
+        click.echo(f"Using the {path} formula execution path.")
+        profile_formulas(profiler, mod, operations, directory, compilation)
+
+
+def profile_formulas(profiler, mod, operations, directory, compilation):
+    suffix = "" if compilation else "_traced"
     with TemporaryConfig() as cfg:
         cfg.ec.mod_implementation = mod
+        cfg.ec.formula_compilation = compilation
         p256 = get_params("secg", "secp256r1", "projective")
         coords = p256.curve.coordinate_model
         add = coords.formulas["add-2015-rcb"]
@@ -45,7 +54,7 @@ def main(profiler, mod, operations, directory):
         with Profiler(
             profiler,
             directory,
-            f"formula_dbl2016rcb_p256_{operations}_{mod}",
+            f"formula_dbl2016rcb_p256{suffix}_{operations}_{mod}",
             operations,
         ):
             for _ in range(operations):
@@ -57,7 +66,7 @@ def main(profiler, mod, operations, directory):
         with Profiler(
             profiler,
             directory,
-            f"formula_add2016rcb_p256_{operations}_{mod}",
+            f"formula_add2016rcb_p256{suffix}_{operations}_{mod}",
             operations,
         ):
             for _ in range(operations):
@@ -74,7 +83,7 @@ def main(profiler, mod, operations, directory):
         with Profiler(
             profiler,
             directory,
-            f"formula_mdbl2008hwcd_ed25519_{operations}_{mod}",
+            f"formula_mdbl2008hwcd_ed25519{suffix}_{operations}_{mod}",
             operations,
         ):
             for _ in range(operations):
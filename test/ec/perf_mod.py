@@ -5,7 +5,7 @@ from pyecsca.ec.mod.base import Mod, mod as make_mod
 from pyecsca.ec.mod.flint import has_flint
 from pyecsca.ec.mod.gmp import has_gmp
 from pyecsca.misc.cfg import TemporaryConfig
-from test.utils import Profiler
+from test.utils import Profiler, RawTimer
 
 
 @click.command()
@@ -19,7 +19,7 @@ from test.utils import Profiler
 @click.option(
     "-m",
     "--mod",
-    type=click.Choice(("python", "gmp", "flint")),
+    type=click.Choice(("python", "gmp", "flint", "montgomery")),
     default="flint" if has_flint else "gmp" if has_gmp else "python",
     envvar="MOD",
 )
@@ -31,7 +31,16 @@ from test.utils import Profiler
     default=None,
     envvar="DIR",
 )
-def main(profiler, mod, operations, directory):
+@click.option(
+    "-c",
+    "--compare",
+    is_flag=True,
+    help="Compare the multiply and square of all implementations over 256-521-bit primes.",
+)
+def main(profiler, mod, operations, directory, compare):
+    if compare:
+        compare_implementations(operations)
+        return
     with TemporaryConfig() as cfg:
         cfg.ec.mod_implementation = mod
         n = 0xFFFFFFFF00000001000000000000000000000000FFFFFFFFFFFFFFFFFFFFFFFF
@@ -119,5 +128,37 @@ def main(profiler, mod, operations, directory):
                 b.cube_root()
 
 
+def compare_implementations(operations):
+    primes = {
+        "P-256": 0xFFFFFFFF00000001000000000000000000000000FFFFFFFFFFFFFFFFFFFFFFFF,
+        "P-384": 2**384 - 2**128 - 2**96 + 2**32 - 1,
+        "P-521": 2**521 - 1,
+    }
+    implementations = ["python", "montgomery"]
+    if has_gmp:
+        implementations.append("gmp")
+    if has_flint:
+        implementations.append("flint")
+    for name, n in primes.items():
+        for mod in implementations:
+            with TemporaryConfig() as cfg:
+                cfg.ec.mod_implementation = mod
+                a = make_mod(0x11111111111111111111111111111111, n)
+                b = make_mod(n - 0xBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB, n)
+                c = a
+                timer = RawTimer()
+                with timer:
+                    for _ in range(operations):
+                        c = c * b
+                mult = timer.duration
+                with timer:
+                    for _ in range(operations):
+                        c = c**2
+                sqr = timer.duration
+            click.echo(
+                f"{name} {mod:>10}: {operations / mult:12.0f} mult/s {operations / sqr:12.0f} sqr/s"
+            )
+
+
 if __name__ == "__main__":
     main()
@@ -5,12 +5,15 @@ from pyecsca.ec.context import (
     DefaultContext,
     Node,
     PathContext,
+    CountingContext,
     Action,
     compound,
 )
 from pyecsca.ec.key_generation import KeyGeneration
 from pyecsca.ec.mod import RandomModAction
 from pyecsca.ec.mult import LTRMultiplier, ScalarMultiplicationAction
+from pyecsca.ec.formula.base import FormulaAction
+from pyecsca.misc.cfg import TemporaryConfig
 
 
 def test_walk_by_key():
@@ -149,6 +152,34 @@ def test_path(mult, secp128r1):
         key_generator.generate()
 
 
+@pytest.mark.parametrize("compilation", [True, False])
+def test_counting(mult, compilation):
+    with local(DefaultContext()) as default:
+        expected = mult.multiply(59)
+    formulas = []
+    default.actions[0].walk(
+        lambda action: formulas.append(action)
+        if isinstance(action, FormulaAction)
+        else None
+    )
+
+    with TemporaryConfig() as cfg, local(CountingContext()) as ctx:
+        cfg.ec.formula_compilation = compilation
+        result = mult.multiply(59)
+    assert result == expected
+    assert ctx.actions == {"ScalarMultiplicationAction": 1}
+    assert sum(ctx.formulas.values()) == len(formulas)
+    for formula, count in ctx.formulas.items():
+        assert count == sum(1 for action in formulas if action.formula == formula)
+    assert sum(ctx.operations.values()) == sum(
+        len(action.op_results) for action in formulas
+    )
+    assert str(ctx) is not None
+
+    ctx.reset()
+    assert not ctx.actions and not ctx.formulas and not ctx.operations
+
+
 def test_str(mult):
     with local(DefaultContext()) as default:
         mult.multiply(59)
@@ -8,17 +8,20 @@ from importlib_resources import files, as_file
 from sympy import FF, symbols
 
 import pyecsca.ec
-from pyecsca.ec.error import UnsatisfiedAssumptionError
+from pyecsca.ec.error import UnsatisfiedAssumptionError, UnsatisfiedAssumptionWarning
 from pyecsca.ec.formula import (
     AdditionFormula,
     DoublingFormula,
     LadderFormula,
     CodeFormula,
+    bind_formula,
 )
 from pyecsca.ec.formula.efd import (
     AdditionEFDFormula,
     DoublingEFDFormula,
     LadderEFDFormula,
+    _efd_cache_load,
+    _efd_cache_store,
 )
 from pyecsca.ec.formula.expand import expand_formula_set, expand_formula_set_parallel
 from pyecsca.ec.formula.fliparoo import generate_fliparood_formulas
@@ -36,7 +39,12 @@ from pyecsca.ec.formula.partitions import (
 )
 from pyecsca.ec.formula.switch_sign import generate_switched_formulas
 from pyecsca.ec.mod import SymbolicMod, mod
-from pyecsca.ec.model import ShortWeierstrassModel, MontgomeryModel, TwistedEdwardsModel
+from pyecsca.ec.model import (
+    ShortWeierstrassModel,
+    MontgomeryModel,
+    TwistedEdwardsModel,
+    EdwardsModel,
+)
 from pyecsca.ec.params import get_params, DomainParameters
 from pyecsca.ec.point import Point
 from pyecsca.misc.cfg import TemporaryConfig
@@ -111,6 +119,49 @@ def test_assumptions(secp128r1, mdbl):
         assert pt is not None
 
 
+def test_bind(secp128r1):
+    madd = secp128r1.curve.coordinate_model.formulas["madd-2015-rcb"]
+    bound = madd.bind(secp128r1)
+    assert bound.parameters == {"b3": secp128r1.curve.parameters["b"] * 3}
+    assert not bound.unsatisfied
+    assert madd.bind(secp128r1) is bound
+
+    before = bind_formula.cache_info()
+    other = secp128r1.generator.to_affine().to_model(
+        secp128r1.curve.coordinate_model, secp128r1.curve
+    )
+    res = bound(secp128r1.generator, other)
+    assert res is not None
+    assert bind_formula.cache_info() == before
+
+    coords = {name: value * 5 for name, value in secp128r1.generator.coords.items()}
+    unscaled = Point(secp128r1.generator.coordinate_model, **coords)
+    with pytest.raises(UnsatisfiedAssumptionError):
+        bound(secp128r1.generator, unscaled)
+
+    before = bind_formula.cache_info()
+    reordered = dict(reversed(list(secp128r1.curve.parameters.items())))
+    madd(secp128r1.curve.prime, secp128r1.generator, other, **reordered)
+    madd(
+        secp128r1.curve.prime, secp128r1.generator, other, **secp128r1.curve.parameters
+    )
+    assert bind_formula.cache_info().hits == before.hits + 2
+
+
+def test_bind_warning():
+    tpl = EdwardsModel().coordinates["projective"].formulas["tpl-2007-bblp-2"]
+    p = 0x7FFFFFFF
+    params = {"c": mod(2, p), "d": mod(3, p)}
+    point = Point(tpl.coordinate_model, X=mod(1, p), Y=mod(2, p), Z=mod(1, p))
+    bound = bind_formula(tpl, p, tuple(sorted(params.items())))
+    assert bound.unsatisfied == ("c == 1",)
+    with TemporaryConfig() as cfg:
+        cfg.ec.unsatisfied_formula_assumption_action = "warning"
+        for _ in range(2):
+            with pytest.warns(UnsatisfiedAssumptionWarning):
+                tpl(p, point, **params)
+
+
 @pytest.mark.parametrize(
     "formula,category,curve,coords",
     [
@@ -171,8 +222,152 @@ def test_symbolic(secp128r1, dbl):
         assert mod(int(symbolic_val), p) == mod(generator_val, p)
 
 
-def test_pickle(add, dbl):
+@pytest.mark.parametrize(
+    "category,curve,coords",
+    [
+        ("secg", "secp128r1", "projective"),
+        ("secg", "secp128r1", "jacobian"),
+        ("other", "Curve25519", "xz"),
+        ("other", "E-222", "projective"),
+        ("other", "Ed25519", "extended"),
+    ],
+)
+def test_compiled(category, curve, coords):
+    params = get_params(category, curve, coords)
+    coordinate_model = params.curve.coordinate_model
+    points = [
+        params.curve.affine_random().to_model(coordinate_model, params.curve)
+        for _ in range(3)
+    ]
+    for formula in coordinate_model.formulas.values():
+        inputs = points[: formula.num_inputs]
+        results = []
+        for compilation in (True, False):
+            with TemporaryConfig() as cfg:
+                cfg.ec.unsatisfied_formula_assumption_action = "ignore"
+                cfg.ec.formula_compilation = compilation
+                try:
+                    results.append(
+                        formula(params.curve.prime, *inputs, **params.curve.parameters)
+                    )
+                except Exception as e:
+                    # Both paths must also fail in the same way (e.g. unsupported formulas).
+                    results.append((type(e), str(e)))
+        compiled, traced = results
+        assert compiled == traced
+
+
+def test_compiled_missing():
+    jacobian = get_params("secg", "secp128r1", "jacobian")
+    neg = jacobian.curve.coordinate_model.formulas["neg"]
+    for compilation in (True, False):
+        with TemporaryConfig() as cfg:
+            cfg.ec.formula_compilation = compilation
+            with pytest.raises(NameError):
+                neg(
+                    jacobian.curve.prime,
+                    jacobian.generator,
+                    **jacobian.curve.parameters,
+                )
+
+
+def test_batch(secp128r1, add, mdbl):
+    coords = secp128r1.curve.coordinate_model
+    points = [
+        secp128r1.curve.affine_random().to_model(coords, secp128r1.curve)
+        for _ in range(10)
+    ]
+    inputs = list(zip(points, reversed(points)))
+    res, intermediates = add.batch(
+        secp128r1.curve.prime, inputs, intermediates=True, **secp128r1.curve.parameters
+    )
+    assert res == [
+        add(secp128r1.curve.prime, *pair, **secp128r1.curve.parameters)
+        for pair in inputs
+    ]
+    assert set(intermediates.keys()) == {op.result for op in add.code}
+    assert all(len(column) == len(inputs) for column in intermediates["X3"])
+
+    res, intermediates = mdbl.batch(
+        secp128r1.curve.prime,
+        [(point,) for point in points],
+        **secp128r1.curve.parameters,
+    )
+    assert intermediates is None
+    assert res == [
+        mdbl(secp128r1.curve.prime, point, **secp128r1.curve.parameters)
+        for point in points
+    ]
+
+    coords = {name: value * 5 for name, value in secp128r1.generator.coords.items()}
+    unscaled = Point(secp128r1.generator.coordinate_model, **coords)
+    with pytest.raises(UnsatisfiedAssumptionError):
+        mdbl.batch(
+            secp128r1.curve.prime,
+            [(secp128r1.generator,), (unscaled,)],
+            **secp128r1.curve.parameters,
+        )
+    with pytest.raises(ValueError):
+        add.batch(secp128r1.curve.prime, [(points[0],)], **secp128r1.curve.parameters)
+
+
+def test_pickle(secp128r1, add, dbl):
     assert add == pickle.loads(pickle.dumps(add))
+    code = add.to_code()
+    code(
+        secp128r1.curve.prime,
+        secp128r1.generator,
+        secp128r1.generator,
+        **secp128r1.curve.parameters,
+    )
+    assert code == pickle.loads(pickle.dumps(code))
+
+
+def test_efd_cache(tmp_path, secp128r1, add):
+    coordinate_model = secp128r1.curve.coordinate_model
+    records = {
+        name: formula._record() for name, formula in coordinate_model.formulas.items()
+    }
+    _efd_cache_store(str(tmp_path), "test", "digest", records)
+    assert _efd_cache_load(str(tmp_path), "test", "digest") == records
+    assert _efd_cache_load(str(tmp_path), "test", "other") is None
+    assert _efd_cache_load(str(tmp_path), "other", "digest") is None
+
+    name = "add-bearssl-v06"
+    with (
+        as_file(files(pyecsca.ec).joinpath("data", "formulas", name)) as meta_path,
+        as_file(
+            files(pyecsca.ec).joinpath("data", "formulas", name + ".op3")
+        ) as op3_path,
+    ):
+        formula = AdditionEFDFormula(
+            meta_path, op3_path, name, ShortWeierstrassModel().coordinates["jacobian"]
+        )
+    cached = AdditionEFDFormula(
+        None, None, name, formula.coordinate_model, record=formula._record()
+    )
+    assert cached.code == formula.code
+    assert [op.result for op in cached.code] == [op.result for op in formula.code]
+    assert cached.assumptions_str == formula.assumptions_str
+    assert cached.parameters == formula.parameters
+    assert cached.meta == formula.meta
+    assert cached.unified == formula.unified
+
+    params = get_params("secg", "secp256r1", "jacobian")
+    other = params.curve.affine_random().to_model(
+        params.curve.coordinate_model, params.curve
+    )
+    expected = formula(
+        params.curve.prime, params.generator, other, **params.curve.parameters
+    )
+    with TemporaryConfig() as cfg:
+        cfg.ec.formula_compilation = False
+        assert expected == cached(
+            params.curve.prime, params.generator, other, **params.curve.parameters
+        )
+    assert expected == cached(
+        params.curve.prime, params.generator, other, **params.curve.parameters
+    )
 
 
 def test_compare(add, dbl):
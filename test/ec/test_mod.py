@@ -1,3 +1,4 @@
+import pickle
 import warnings
 
 import pytest
@@ -16,8 +17,10 @@ from pyecsca.ec.mod import (
     Undefined,
     miller_rabin,
     RawMod,
+    MontgomeryMod,
     SymbolicMod,
     jacobi, cube_roots,
+    batch_inverse,
 )
 from pyecsca.ec.mod.gmp import has_gmp
 from pyecsca.ec.mod.flint import has_flint
@@ -67,6 +70,31 @@ def test_inverse():
     getconfig().ec.no_inverse_action = "error"
 
 
+def test_batch_inverse():
+    p = 0xFFFFFFFF00000001000000000000000000000000FFFFFFFFFFFFFFFFFFFFFFFF
+    elements = [mod(i * 0x123456789 + 5, p) for i in range(10)]
+    assert batch_inverse(elements) == [element.inverse() for element in elements]
+    assert batch_inverse([]) == []
+    with pytest.raises(NonInvertibleError):
+        batch_inverse([mod(2, p), mod(0, p)])
+    with TemporaryConfig() as cfg:
+        cfg.ec.no_inverse_action = "warning"
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            res = batch_inverse([mod(2, p), mod(0, p), mod(3, p)])
+        assert len(w) == 1
+        assert issubclass(w[0].category, NonInvertibleWarning)
+        assert res == [mod(2, p).inverse(), mod(0, p), mod(3, p).inverse()]
+    with pytest.raises(NonInvertibleError):
+        batch_inverse([mod(3, 10), mod(5, 10)])
+    with TemporaryConfig() as cfg:
+        cfg.ec.no_inverse_action = "ignore"
+        assert batch_inverse([mod(3, 10), mod(5, 10)]) == [
+            mod(3, 10).inverse(),
+            mod(5, 10).inverse(),
+        ]
+
+
 def test_is_residue():
     assert mod(4, 11).is_residue()
     assert not mod(11, 31).is_residue()
@@ -254,3 +282,33 @@ def test_symbolic():
     r = sx * a + b
     assert isinstance(r, SymbolicMod)
     assert r.n == p
+
+
+def test_montgomery():
+    p = 0xFFFFFFFF00000001000000000000000000000000FFFFFFFFFFFFFFFFFFFFFFFF
+    with TemporaryConfig() as cfg:
+        cfg.ec.mod_implementation = "montgomery"
+        a = mod(0x702BDAFD3C1C837B23A1CB196ED7F9FADB333C5CFE4A462BE32ADCD67BFB6AC1, p)
+        b = mod(0x1CB2E5274BBA085C4CA88EEDE75AE77949E7A410C80368376E97AB22EB590F9D, p)
+        assert isinstance(a, MontgomeryMod)
+        assert isinstance(mod(5, 10), RawMod)
+        assert int(a * b) == (int(a) * int(b)) % p
+        assert int(a + b) == (int(a) + int(b)) % p
+        assert int(a - b) == (int(a) - int(b)) % p
+        assert int(b - a) == (int(b) - int(a)) % p
+        assert int(-a) == p - int(a)
+        assert -mod(0, p) == 0
+        assert a ** 2 == a * a
+        assert int(a ** 5) == pow(int(a), 5, p)
+        assert a.inverse() * a == 1
+        assert (a * a).sqrt() in (a, -a)
+        assert (a * a * a).cube_root() ** 3 == a * a * a
+        assert bytes(a) == int(a).to_bytes(32, byteorder="big")
+        assert a == int(a)
+        assert a == int(a) - p
+        assert a != b
+        assert hash(a) == hash(mod(int(a), p))
+        assert a.bit_length() == int(a).bit_length()
+        assert pickle.loads(pickle.dumps(a)) == a
+        with pytest.raises(NonInvertibleError):
+            mod(0, p).inverse()
@@ -1,4 +1,5 @@
 import pickle
+from multiprocessing import get_context
 
 from pyecsca.ec.model import (
     ShortWeierstrassModel,
@@ -24,3 +25,28 @@ def test_pickle():
     assert m == pickle.loads(pickle.dumps(MontgomeryModel()))
     assert e == pickle.loads(pickle.dumps(EdwardsModel()))
     assert te == pickle.loads(pickle.dumps(TwistedEdwardsModel()))
+
+
+def lazy_target():
+    sw = ShortWeierstrassModel()
+    loaded_before = sw.coordinates.loaded("projective")
+    coords = sw.coordinates["projective"]
+    coords.formulas["add-2015-rcb"]
+    return (
+        loaded_before,
+        coords.formulas.loaded("add-2015-rcb"),
+        sw.coordinates.loaded("jacobian"),
+    )
+
+
+def test_lazy():
+    # In a fresh process, nothing is loaded until it is accessed.
+    with get_context("spawn").Pool(processes=1) as pool:
+        loaded_before, formula_after, other = pool.apply(lazy_target)
+    assert not loaded_before
+    assert formula_after
+    assert not other
+    sw = ShortWeierstrassModel()
+    assert "projective" in sw.coordinates
+    assert "add-2015-rcb" in sw.coordinates["projective"].formulas
+    assert "nonexistent" not in sw.coordinates
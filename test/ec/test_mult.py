@@ -23,8 +23,11 @@ from pyecsca.ec.mult import (
     CombMultiplier,
     WindowBoothMultiplier,
 )
+from pyecsca.ec.context import local, DefaultContext
+from pyecsca.ec.mult.base import precomputation_cache, PrecomputationAction
 from pyecsca.ec.mult.fixed import FullPrecompMultiplier
 from pyecsca.ec.point import InfinityPoint, Point
+from pyecsca.misc.cfg import TemporaryConfig
 
 
 def get_formulas(coords, *names):
@@ -516,3 +519,40 @@ def test_init_fail(curve25519, secp128r1):
             scl=curve25519.curve.coordinate_model.formulas["scale"],
             complete=False,
         )
+
+
+def test_precomputation_cache(secp128r1):
+    add, dbl, neg = get_formulas(secp128r1.curve.coordinate_model, "add-2015-rcb", "dbl-2015-rcb", "neg")
+    precomputation_cache.clear()
+    one = WindowNAFMultiplier(add, dbl, neg, 3, precompute_negation=True)
+    one.init(secp128r1, secp128r1.generator)
+    assert precomputation_cache.misses == 1
+    other = WindowNAFMultiplier(add, dbl, neg, 3, precompute_negation=True)
+    other.init(secp128r1, secp128r1.generator)
+    assert precomputation_cache.hits == 1
+    assert other._points == one._points
+    assert other._points_neg == one._points_neg
+    assert other.multiply(314) == one.multiply(314)
+
+    wider = WindowNAFMultiplier(add, dbl, neg, 4, precompute_negation=True)
+    wider.init(secp128r1, secp128r1.generator)
+    assert precomputation_cache.misses == 2
+    wider.init(secp128r1, secp128r1.generator, bits=64)
+    assert precomputation_cache.misses == 3
+    assert len(precomputation_cache) == 3
+    assert precomputation_cache.hit_rate == 0.25
+
+    # A traced precomputation is always computed.
+    with local(DefaultContext()) as ctx:
+        other.init(secp128r1, secp128r1.generator)
+    action = ctx.actions[0].action
+    assert isinstance(action, PrecomputationAction)
+    assert ctx.actions[0].children
+    assert precomputation_cache.hits == 1
+
+    with TemporaryConfig() as cfg:
+        cfg.ec.precomputation_cache = False
+        other.init(secp128r1, secp128r1.generator)
+    assert precomputation_cache.hits == 1
+    precomputation_cache.clear()
+    assert len(precomputation_cache) == 0
@@ -105,6 +105,20 @@ def test_assumption():
     assert get_params("secg", "secp128r1", "projective-3") is not None
 
 
+def test_memoized():
+    params = get_params("secg", "secp128r1", "projective")
+    assert get_params("secg", "secp128r1", "projective") is params
+    assert get_params("secg", "secp128r1", "jacobian") is not params
+    assert get_params("secg", "secp128r1", "projective", False) is not params
+    with TemporaryConfig() as cfg:
+        cfg.ec.mod_implementation = "python"
+        other = get_params("secg", "secp128r1", "projective")
+        assert other is not params
+        assert other.curve.prime == params.curve.prime
+    category = get_category("secg", "projective")
+    assert params in category.curves
+
+
 def test_infty():
     with pytest.raises(ValueError):
         get_params("other", "Ed25519", "modified", False)
@@ -8,7 +8,8 @@ from pyecsca.ec.mod import mod
 from pyecsca.ec.model import ShortWeierstrassModel, MontgomeryModel
 from pyecsca.ec.params import get_params
 from pyecsca.ec.point import Point, InfinityPoint
-from pyecsca.ec.error import UnsatisfiedAssumptionError
+from pyecsca.ec.error import UnsatisfiedAssumptionError, NonInvertibleError
+from pyecsca.misc.cfg import TemporaryConfig
 
 
 @pytest.fixture()
@@ -28,6 +29,28 @@ def test_construction(secp128r1_coords):
         Point(secp128r1_coords, X=mod(1, 3), Y=mod(2, 7), Z=mod(1, 3))
 
 
+def test_coords(secp128r1, secp128r1_coords):
+    p = secp128r1.curve.prime
+    pt = Point(secp128r1_coords, Z=mod(2, p), X=mod(4, p), Y=mod(6, p))
+    other = Point(secp128r1_coords, X=mod(4, p), Y=mod(6, p), Z=mod(2, p))
+    assert pt.X == mod(4, p)
+    assert pt.Z == mod(2, p)
+    assert pt.coords == {"X": mod(4, p), "Y": mod(6, p), "Z": mod(2, p)}
+    assert list(pt.coords.keys()) == secp128r1_coords.variables
+    assert pt.field == p
+    assert pt == other
+    assert hash(pt) == hash(other)
+    assert str(pt) == str(other)
+    with pytest.raises(AttributeError):
+        pt.W
+    with pytest.raises(AttributeError):
+        pt.something = 1
+
+    trusted = Point._trusted(secp128r1_coords, (mod(4, p), mod(6, p), mod(2, p)), p)
+    assert trusted == pt
+    assert hash(trusted) == hash(pt)
+
+
 def test_to_affine(secp128r1, secp128r1_coords, affine_model):
     pt = Point(
         secp128r1_coords,
@@ -55,6 +78,40 @@ def test_to_affine(secp128r1, secp128r1_coords, affine_model):
     assert modified is not None
 
 
+def test_batch_to_affine(secp128r1, secp128r1_coords):
+    points = [
+        secp128r1.curve.affine_random().to_model(
+            secp128r1_coords, secp128r1.curve, randomized=True
+        )
+        for _ in range(10)
+    ]
+    points.append(InfinityPoint(secp128r1_coords))
+    points.append(secp128r1.generator.to_affine())
+    secp128r1_jacobian = get_params("secg", "secp128r1", "jacobian")
+    points.append(secp128r1_jacobian.generator)
+    assert Point.batch_to_affine(points) == [point.to_affine() for point in points]
+    assert Point.batch_to_affine([]) == []
+
+    zero = Point(
+        secp128r1_coords,
+        X=mod(1, secp128r1.curve.prime),
+        Y=mod(1, secp128r1.curve.prime),
+        Z=mod(0, secp128r1.curve.prime),
+    )
+    with pytest.raises(NonInvertibleError):
+        Point.batch_to_affine([points[0], zero])
+    with TemporaryConfig() as cfg:
+        cfg.ec.no_inverse_action = "ignore"
+        assert Point.batch_to_affine([points[0], zero]) == [
+            points[0].to_affine(),
+            zero.to_affine(),
+        ]
+
+    secp128r1_xz = get_params("secg", "secp128r1", "xz")
+    with pytest.raises(NotImplementedError):
+        Point.batch_to_affine([secp128r1_xz.generator])
+
+
 def test_to_model(secp128r1, secp128r1_coords, affine_model):
     affine = Point(
         affine_model,